@@ -7,6 +7,8 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+WARMUP_ITERATIONS = 5
+
 
 class SimpleModel(nn.Module):
     def __init__(self):
@@ -18,6 +20,14 @@ class SimpleModel(nn.Module):
 
 
 def create_and_save_model():
+    """
+    Trace SimpleModel and save it as a frozen, inference-optimized TorchScript artifact.
+
+    Freezing folds the weights into the graph as constants, which lets
+    optimize_for_inference constant-propagate and fuse operators. The saved
+    graph is inference-only, so loaders should still call .eval() after
+    torch.jit.load (PyTorchLoader does).
+    """
     # Get absolute path to project root
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     models_dir = os.path.join(project_root, 'models')
@@ -26,11 +36,18 @@ def create_and_save_model():
     os.makedirs(models_dir, exist_ok=True)
 
     # Create and initialize the model
-    model = SimpleModel()
+    model = SimpleModel().eval()
 
-    # Convert to TorchScript
+    # Convert to TorchScript, then freeze and optimize the graph for inference
     example_input = torch.randn(2)
     traced_model = torch.jit.trace(model, example_input)
+    traced_model = torch.jit.freeze(traced_model)
+    traced_model = torch.jit.optimize_for_inference(traced_model)
+
+    # Warm up so the JIT profiling/specialization cost is paid at build time
+    with torch.inference_mode():
+        for _ in range(WARMUP_ITERATIONS):
+            traced_model(example_input)
 
     # Save the model
     model_path = os.path.join(models_dir, 'simple_model.pt')
@@ -40,7 +57,7 @@ def create_and_save_model():
     # Test loading
     loaded_model = torch.jit.load(model_path)
     test_input = torch.tensor([1.0, 2.0])
-    with torch.no_grad():
+    with torch.inference_mode(), torch.jit.optimized_execution(False):
         output = loaded_model(test_input)
     logger.info(f"Test prediction with input {test_input}: {output.item()}")
 
@@ -1,39 +1,81 @@
 # examples/test_inference.py
 import asyncio
-import httpx
+import sys
+import time
+import aiohttp
 import logging
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def test_model():
-    async with httpx.AsyncClient() as client:
-        # Create sample input
-        input_data = {
-            "inputs": {
-                "data": [1.0, 2.0]
-            }
+PREDICT_URL = "http://localhost:8000/v1/models/simple_model/predict"
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a session whose keep-alive connection pool is shared by all requests"""
+    connector = aiohttp.TCPConnector(limit=256, keepalive_timeout=60)
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30.0)
+    )
+
+
+async def send_prediction(session: aiohttp.ClientSession, input_data: dict) -> int:
+    async with session.post(PREDICT_URL, json=input_data) as response:
+        body = await response.text()
+        if response.status != 200:
+            logger.error(f"Prediction failed: {body}")
+        return response.status
+
+
+async def test_model(num_requests: int = 1):
+    # Create sample input
+    input_data = {
+        "inputs": {
+            "data": [1.0, 2.0]
         }
+    }
 
+    async with create_session() as session:
         try:
-            logger.info("Sending prediction request...")
-            response = await client.post(
-                "http://localhost:8000/v1/models/simple_model/predict",
-                json=input_data,
-                timeout=30.0
-            )
+            if num_requests == 1:
+                logger.info("Sending prediction request...")
+                async with session.post(PREDICT_URL, json=input_data) as response:
+                    body = await response.text()
+
+                    logger.info(f"Status Code: {response.status}")
+                    logger.info(f"Response Headers: {response.headers}")
+                    logger.info(f"Response Body: {body}")
 
-            logger.info(f"Status Code: {response.status_code}")
-            logger.info(f"Response Headers: {response.headers}")
-            logger.info(f"Response Body: {response.text}")
+                    if response.status == 200:
+                        logger.info(f"Prediction successful: {await response.json()}")
+                    else:
+                        logger.error(f"Prediction failed: {body}")
+                return
 
-            if response.status_code == 200:
-                logger.info(f"Prediction successful: {response.json()}")
-            else:
-                logger.error(f"Prediction failed: {response.text}")
+            # Fire requests concurrently so the connection pool is exercised
+            logger.info(f"Sending {num_requests} concurrent prediction requests...")
+            start_time = time.perf_counter()
+            statuses = await asyncio.gather(*[
+                send_prediction(session, input_data) for _ in range(num_requests)
+            ])
+            elapsed = time.perf_counter() - start_time
+
+            succeeded = sum(1 for status in statuses if status == 200)
+            logger.info(
+                f"{succeeded}/{num_requests} succeeded in {elapsed:.2f}s "
+                f"({num_requests / elapsed:.1f} req/s)"
+            )
 
         except Exception as e:
             logger.error(f"Request failed: {str(e)}")
 
 if __name__ == "__main__":
-    asyncio.run(test_model())
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(test_model(int(sys.argv[1]) if len(sys.argv) > 1 else 1))
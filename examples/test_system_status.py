@@ -1,37 +1,53 @@
 import asyncio
-import httpx
+import aiohttp
 import logging
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+STATUS_URL = "http://localhost:8000/v1/models/status"
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a session whose keep-alive connection pool is shared by all requests"""
+    connector = aiohttp.TCPConnector(limit=256, keepalive_timeout=60)
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30.0)
+    )
+
 
 async def test_system_status():
-    async with httpx.AsyncClient() as client:
+    async with create_session() as session:
         try:
             logger.info("Checking system status...")
-            response = await client.get(
-                "http://localhost:8000/v1/models/status",
-                timeout=30.0
-            )
-
-            logger.info(f"Status Code: {response.status_code}")
-            logger.info(f"Response Headers: {response.headers}")
-            logger.info(f"Response Body: {response.text}")
-
-            if response.status_code == 200:
-                status = response.json()
-                logger.info("\nSystem Status:")
-                logger.info(f"Active Models: {status['active_models']}")
-                logger.info(f"Memory Usage: {status['total_memory_usage']}")
-                logger.info(f"Cache Utilization: {status['cache_utilization']:.2%}")
-                logger.info(f"Healthy: {status['healthy']}")
-                logger.info(f"Uptime: {status['uptime']}")
-            else:
-                logger.error(f"Status check failed: {response.text}")
+            async with session.get(STATUS_URL) as response:
+                body = await response.text()
+
+                logger.info(f"Status Code: {response.status}")
+                logger.info(f"Response Headers: {response.headers}")
+                logger.info(f"Response Body: {body}")
+
+                if response.status == 200:
+                    status = await response.json()
+                    logger.info("\nSystem Status:")
+                    logger.info(f"Active Models: {status['active_models']}")
+                    logger.info(f"Memory Usage: {status['total_memory_usage']}")
+                    logger.info(f"Cache Utilization: {status['cache_utilization']:.2%}")
+                    logger.info(f"Healthy: {status['healthy']}")
+                    logger.info(f"Uptime: {status['uptime']}")
+                else:
+                    logger.error(f"Status check failed: {body}")
 
         except Exception as e:
             logger.error(f"Request failed: {str(e)}")
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(test_system_status())
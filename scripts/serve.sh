@@ -0,0 +1,31 @@
+#!/bin/bash
+
+# Add the src directory to PYTHONPATH
+export PYTHONPATH=$PYTHONPATH:$(pwd)/src
+
+# Colors for prettier output
+GREEN='\033[0;32m'
+BLUE='\033[0;34m'
+NC='\033[0m'
+
+# Activate virtual environment if it exists
+if [ -d "venv" ]; then
+    source venv/bin/activate
+fi
+
+# One worker per core unless overridden; each worker gets an even share of
+# the cores for inference threads (see configure_threads)
+export PORTFOLIO_WORKERS="${PORTFOLIO_WORKERS:-$(nproc)}"
+export PORTFOLIO_CONFIG_PATH="${PORTFOLIO_CONFIG_PATH:-config/development/config.yaml}"
+export OMP_NUM_THREADS="${OMP_NUM_THREADS:-$(( $(nproc) / PORTFOLIO_WORKERS > 0 ? $(nproc) / PORTFOLIO_WORKERS : 1 ))}"
+
+echo -e "${BLUE}Starting Portfolio with ${PORTFOLIO_WORKERS} workers...${NC}"
+
+# uvloop event loop and httptools parser (installed via uvicorn[standard])
+uvicorn portfolio.main:app \
+    --host 0.0.0.0 \
+    --port 8000 \
+    --loop uvloop \
+    --http httptools \
+    --workers "$PORTFOLIO_WORKERS" \
+    --backlog 2048
@@ -6,9 +6,9 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     install_requires=[
-        "fastapi>=0.68.0",
-        "uvicorn>=0.15.0",
+        "fastapi>=0.100.0",
+        "uvicorn[standard]>=0.23.0",
         "pyyaml>=5.4.1",
-        "pydantic>=1.8.2",
+        "pydantic>=2.5",
     ],
 )
@@ -1,54 +1,125 @@
 # src/portfolio/api/dependencies.py
 from typing import Annotated, Optional
+from functools import lru_cache
 from portfolio.core.manager import ModelManager
+from portfolio.core.batching import InferenceBatcher
+from portfolio.models.loader.pytorch import configure_threads
 from portfolio.utils.metrics import MetricsCollector
 import os
 import logging
+import threading
 
-from fastapi import Depends
+from fastapi import Depends, FastAPI, Request
 
 logger = logging.getLogger(__name__)
 
 
-# Singleton instances
-_model_manager: Optional[ModelManager] = None
-_metrics_collector: Optional[MetricsCollector] = None
-
-
+@lru_cache(maxsize=1)
 def get_config_path() -> str:
     """Get configuration path from environment or default"""
     return os.getenv('PORTFOLIO_CONFIG_PATH', 'config/development/config.yaml')
 
 
-def reset_model_manager():
-    """Reset the global model manager instance"""
-    global _model_manager
-    if _model_manager is not None:
+def reset_model_manager(app: Optional[FastAPI] = None):
+    """Reset the global model manager instance.
+
+    The old batcher's worker is cancelled, and if ``app`` is given its state
+    drops the old instances so requests resolve the new ones.
+    """
+    if init_inference_batcher.cache_info().currsize:
+        init_inference_batcher().cancel()
+    if init_model_manager.cache_info().currsize:
         # Clean up existing manager
-        for model_id in list(_model_manager._active_models):
-            _model_manager.remove_model(model_id)
-        _model_manager.cache.clear()
-    _model_manager = None
+        model_manager = init_model_manager()
+        for model_id in list(model_manager._active_models):
+            model_manager.remove_model(model_id)
+        model_manager.cache.clear()
+    for cached in (init_model_manager, _build_model_manager, init_inference_batcher, _build_inference_batcher):
+        cached.cache_clear()
+    get_config_path.cache_clear()
+    if app is not None:
+        for name in ('model_manager', 'inference_batcher'):
+            if hasattr(app.state, name):
+                delattr(app.state, name)
     logger.info("Reset global ModelManager instance")
 
-def get_model_manager() -> ModelManager:
+
+# Process-wide singletons. The app lifespan builds each one at startup, before
+# any request is served; apps run without a lifespan (e.g. tests) build them
+# lazily on first use. lru_cache alone lets two threads that miss together
+# both run the builder, so the first build re-checks a private cache under
+# this lock (re-entrant, since building the batcher builds the manager).
+_init_lock = threading.RLock()
+
+
+@lru_cache(maxsize=1)
+def init_model_manager() -> ModelManager:
+    """Create the process-wide ModelManager exactly once"""
+    with _init_lock:
+        return _build_model_manager()
+
+
+@lru_cache(maxsize=1)
+def _build_model_manager() -> ModelManager:
+    workers = os.getenv('PORTFOLIO_WORKERS')
+    if workers:
+        configure_threads(int(workers))
+    config_path = get_config_path()
+    logger.info(f"Creating new ModelManager with config: {config_path}")
+    return ModelManager(config_path)
+
+
+@lru_cache(maxsize=1)
+def init_metrics_collector() -> MetricsCollector:
+    """Create the process-wide MetricsCollector exactly once"""
+    with _init_lock:
+        return _build_metrics_collector()
+
+
+@lru_cache(maxsize=1)
+def _build_metrics_collector() -> MetricsCollector:
+    return MetricsCollector()
+
+
+@lru_cache(maxsize=1)
+def init_inference_batcher() -> InferenceBatcher:
+    """Create the process-wide InferenceBatcher exactly once"""
+    with _init_lock:
+        return _build_inference_batcher()
+
+
+@lru_cache(maxsize=1)
+def _build_inference_batcher() -> InferenceBatcher:
+    model_manager = init_model_manager()
+    batching = model_manager.config.get('batching') or {}
+    return InferenceBatcher(
+        model_manager,
+        max_batch_size=batching.get('max_batch_size', 64),
+        batch_timeout_micros=batching.get('batch_timeout_micros', 2000),
+        max_pending=batching.get('max_pending', 1024),
+        max_queue_delay_ms=batching.get('max_queue_delay_ms', 1000.0)
+    )
+
+
+def get_model_manager(request: Request) -> ModelManager:
     """Dependency provider for ModelManager"""
-    global _model_manager
-    if _model_manager is None:
-        config_path = os.getenv('PORTFOLIO_CONFIG_PATH', 'config/development/config.yaml')
-        logger.info(f"Creating new ModelManager with config: {config_path}")
-        _model_manager = ModelManager(config_path)
-    return _model_manager
+    model_manager = getattr(request.app.state, 'model_manager', None)
+    return model_manager if model_manager is not None else init_model_manager()
 
 
-def get_metrics_collector() -> MetricsCollector:
+def get_metrics_collector(request: Request) -> MetricsCollector:
     """Dependency provider for MetricsCollector"""
-    global _metrics_collector
-    if _metrics_collector is None:
-        _metrics_collector = MetricsCollector()
-    return _metrics_collector
+    metrics = getattr(request.app.state, 'metrics', None)
+    return metrics if metrics is not None else init_metrics_collector()
+
+
+def get_inference_batcher(request: Request) -> InferenceBatcher:
+    """Dependency provider for InferenceBatcher"""
+    batcher = getattr(request.app.state, 'inference_batcher', None)
+    return batcher if batcher is not None else init_inference_batcher()
 
 
 # Type aliases for dependency injection
 ModelManagerDep = Annotated[ModelManager, Depends(get_model_manager)]
 MetricsCollectorDep = Annotated[MetricsCollector, Depends(get_metrics_collector)]
+InferenceBatcherDep = Annotated[InferenceBatcher, Depends(get_inference_batcher)]
@@ -0,0 +1,36 @@
+# src/portfolio/api/responses.py
+from typing import Any
+import json
+import logging
+
+from fastapi.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    logger.warning("orjson not installed, falling back to stdlib JSON encoding")
+    orjson = None
+
+
+def _to_builtin(obj: Any) -> Any:
+    """Fallback encoder for array-likes (numpy arrays, tensors) without orjson"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson's C encoder when available"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return json.dumps(
+                content,
+                ensure_ascii=False,
+                allow_nan=False,
+                separators=(",", ":"),
+                default=_to_builtin
+            ).encode("utf-8")
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
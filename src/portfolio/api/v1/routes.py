@@ -1,14 +1,16 @@
 # src/portfolio/api/v1/routes.py
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from portfolio.api.dependencies import ModelManagerDep, MetricsCollectorDep
+from fastapi import APIRouter, HTTPException, Request
+from portfolio.api.dependencies import ModelManagerDep, MetricsCollectorDep, InferenceBatcherDep
+from portfolio.api.responses import ORJSONResponse
+from portfolio.core.batching import BatcherOverloadedError
 import time
 import logging
-from datetime import datetime
-import humanize  # Add this to requirements.txt if not present
+from datetime import timedelta
+from functools import lru_cache
+from humanize import naturalsize, naturaltime
 
 
-from typing import Dict, List
-from pydantic import Field
+from typing import List
 
 
 # request and response schemas
@@ -24,15 +26,29 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Formatting for ?humanize=true, memoized on whole bytes/seconds
+@lru_cache(maxsize=2048)
+def _natural_size(size_bytes: int) -> str:
+    return naturalsize(size_bytes)
+
+
+@lru_cache(maxsize=2048)
+def _natural_time(seconds_ago: int) -> str:
+    return naturaltime(timedelta(seconds=seconds_ago))
+
 
 @router.get("/models", response_model=ModelsList)
 async def list_models(
     model_manager: ModelManagerDep,
-    metrics: MetricsCollectorDep
+    metrics: MetricsCollectorDep,
+    humanize: bool = False
 ) -> ModelsList:
     """
     List all available models and their current status.
 
+    Memory usage is reported in bytes and last use as a unix timestamp;
+    pass ``?humanize=true`` for human-readable strings instead.
+
     Returns:
         ModelsList containing summaries of all registered models
     """
@@ -41,37 +57,30 @@ async def list_models(
         models_config = model_manager.config.get('models', {})
         model_summaries: List[ModelSummary] = []
         loaded_count = 0
+        now = time.time()
+        get_size = model_manager.cache.get_size
+        get_last_used = model_manager.cache.get_last_access_timestamp
 
         for model_id, config in models_config.items():
-            # Check if model is currently in cache
-            is_loaded = model_manager.cache.get(model_id) is not None
+            # A cached size means the model is loaded; unlike cache.get(),
+            # this does not count as a use of the model
+            memory_bytes = get_size(model_id)
+            is_loaded = memory_bytes is not None
             if is_loaded:
                 loaded_count += 1
                 status = "loaded"
             else:
                 status = "unloaded"
+                memory_bytes = 0
 
             # Get last access time
-            last_access = model_manager.cache.get_last_access_time(model_id)
-            if last_access:
-                last_used = humanize.naturaltime(datetime.now() - last_access)
-            else:
-                last_used = "never"
+            last_used = get_last_used(model_id)
 
-            # Get memory usage
-            if is_loaded:
-                model = await model_manager.get_model(model_id)
-                if model:
-                    loader = model_manager.loaders.get(config['type'].lower())
-                    if loader is not None:
-                        memory_bytes = loader.get_memory_usage(model)
-                        memory_usage = humanize.naturalsize(memory_bytes)
-                    else:
-                        memory_usage = "unknown"
-                else:
-                    memory_usage = "unknown"
+            if humanize:
+                memory_usage = _natural_size(memory_bytes)
+                last_used = _natural_time(int(now - last_used)) if last_used else "never"
             else:
-                memory_usage = "0 B"
+                memory_usage = memory_bytes
 
             model_summaries.append(ModelSummary(
                 model_id=model_id,
@@ -96,21 +105,22 @@ async def list_models(
         )
 
 
-@router.post("/models/{model_id}/predict", response_model=PredictionResponse)
+@router.post("/models/{model_id}/predict", response_model=PredictionResponse, response_class=ORJSONResponse)
 async def predict(
     model_id: str,
     request: PredictionRequest,
     model_manager: ModelManagerDep,
     metrics: MetricsCollectorDep,
-    background_tasks: BackgroundTasks
-) -> PredictionResponse:
+    batcher: InferenceBatcherDep
+) -> ORJSONResponse:
     """Perform model inference on the provided input data."""
     try:
-        logger.info(f"Received prediction request for model: {model_id}")
-        logger.debug(f"Input data: {request.inputs}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received prediction request for model %s: %s", model_id, request.inputs)
 
         # First check if model exists in configuration
-        if model_id not in model_manager.config.get('models', {}):
+        model_entry = model_manager.get_model_entry(model_id)
+        if model_entry is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Model {model_id} not found"
@@ -118,37 +128,36 @@ async def predict(
 
         start_time = time.time()
 
-        # Get model from manager (handles loading if needed)
-        model = await model_manager.get_model(model_id)
-        if model is None:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Model {model_id} failed to load"
-            )
-
-        # Perform inference
-        outputs = await model_manager.predict(
+        # Perform inference, coalesced with concurrent requests; each batch
+        # resolves (and if needed loads) the model once for all its requests
+        outputs = await batcher.submit(
             model_id,
             request.inputs,
             request.parameters or {}
         )
 
-        logger.info(f"Inference completed for model {model_id}")
-        logger.debug(f"Outputs: {outputs}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Inference completed for model %s: %s", model_id, outputs)
 
-        # Record metrics
+        # Record metrics (an O(1) buffered append, so done inline)
         duration = time.time() - start_time
-        background_tasks.add_task(metrics.record_inference, model_id, duration)
+        metrics.record_inference(model_id, duration)
 
-        return PredictionResponse(
-            model_id=model_id,
-            outputs=outputs,
-            metadata={
+        # Serialize directly, bypassing response_model validation on the hot path
+        return ORJSONResponse({
+            "model_id": model_id,
+            "outputs": outputs,
+            "metadata": {
                 "duration_ms": round(duration * 1000, 2),
-                "model_version": getattr(model, 'version', 'unknown')
+                "model_version": model_entry.version
             }
-        )
+        })
 
+    except HTTPException:
+        raise
+    except BatcherOverloadedError as e:
+        logger.warning(f"Shedding prediction request for model {model_id}: {str(e)}")
+        raise HTTPException(status_code=503, detail="Server overloaded, retry later")
     except Exception as e:
         logger.error(f"Prediction failed for model {model_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -177,16 +186,19 @@ async def get_model_metadata(
             total_requests=metrics.get_request_count(),
             average_latency=metrics.get_inference_time_avg(model_id)
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to retrieve metadata for model {model_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/models/status", response_model=SystemStatus)
+@router.get("/models/status", response_model=SystemStatus, response_class=ORJSONResponse)
 async def get_system_status(
     model_manager: ModelManagerDep,
-    metrics: MetricsCollectorDep
-) -> SystemStatus:
+    metrics: MetricsCollectorDep,
+    batcher: InferenceBatcherDep
+) -> ORJSONResponse:
     """Get system-wide status information."""
     try:
         system_metrics = metrics.get_system_metrics()
@@ -196,24 +208,33 @@ async def get_system_status(
         active_models = model_manager.active_model_count  # Use the new property
         logger.info(f"Current active models: {active_models}")
 
-        return SystemStatus(
-            active_models=active_models,  # Use the count from model manager
-            total_memory_usage=f"{system_metrics['memory_usage'] / (1024*1024):.2f}MB",
-            cache_utilization=cache_stats['utilization'],
-            healthy=True,
-            uptime=f"{system_metrics['uptime']:.1f}s"
-        )
+        memory_bytes = system_metrics['memory_usage']
+        return ORJSONResponse({
+            "active_models": active_models,  # Use the count from model manager
+            "total_memory_usage": f"{memory_bytes / (1024*1024):.2f}MB",
+            "total_memory_bytes": memory_bytes,
+            "cache_utilization": float(cache_stats['utilization']),
+            "healthy": not batcher.overloaded,
+            "uptime": f"{system_metrics['uptime']:.1f}s",
+            "queue_depth": batcher.queue_depth,
+            "estimated_queue_delay_ms": round(batcher.estimated_queue_delay * 1000, 2)
+        })
     except Exception as e:
         logger.error(f"Failed to retrieve system status: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/health")
-async def health_check() -> Dict[str, str]:
+@router.get("/health", response_class=ORJSONResponse)
+async def health_check(request: Request) -> ORJSONResponse:
     """
     Basic health check endpoint.
 
+    Reports 503 until startup model preloading and warm-up have finished,
+    so orchestrators don't route traffic to a cold instance.
+
     Returns:
-        Dictionary with status information
+        Response with status information
     """
-    return {"status": "healthy"}
+    if not getattr(request.app.state, 'ready', True):
+        return ORJSONResponse({"status": "starting"}, status_code=503)
+    return ORJSONResponse({"status": "healthy"})
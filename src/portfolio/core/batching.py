@@ -0,0 +1,215 @@
+# src/portfolio/core/batching.py
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Smoothing factor for the service-rate moving average
+_RATE_EMA_ALPHA = 0.2
+
+
+class BatcherOverloadedError(RuntimeError):
+    """Raised when the inference queue is too deep to admit more requests"""
+
+
+class InferenceRequest(NamedTuple):
+    """A single queued prediction awaiting a batched forward pass"""
+    model_id: str
+    inputs: Dict[str, Any]
+    parameters: Dict[str, Any]
+    future: asyncio.Future
+
+
+def _batch_key(request: InferenceRequest) -> Tuple[str, Hashable]:
+    """Group requests by model and input length so they can be stacked"""
+    data = request.inputs.get('data')
+    length = len(data) if isinstance(data, (list, tuple)) else None
+    return request.model_id, length
+
+
+class InferenceBatcher:
+    """
+    Coalesces concurrent prediction requests into batched model calls.
+
+    Requests are pushed onto an asyncio.Queue and drained by a single
+    background coroutine, which collects up to ``max_batch_size`` items
+    (or whatever arrives within ``batch_timeout_micros``) and dispatches
+    each model/input-length group with one ``ModelManager.predict_batch``
+    call.
+
+    New requests are rejected with BatcherOverloadedError once
+    ``max_pending`` requests are in flight, or once the estimated queueing
+    delay (pending requests over the smoothed service rate) exceeds
+    ``max_queue_delay_ms``.
+    """
+
+    def __init__(
+        self,
+        model_manager,
+        max_batch_size: int = 64,
+        batch_timeout_micros: int = 2000,
+        max_pending: int = 1024,
+        max_queue_delay_ms: float = 1000.0
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}")
+
+        self.model_manager = model_manager
+        self.max_batch_size = max_batch_size
+        self.batch_timeout = batch_timeout_micros / 1_000_000
+        self.max_pending = max_pending
+        self.max_queue_delay = max_queue_delay_ms / 1000
+        self._pending = 0
+        self._service_rate: Optional[float] = None  # requests/second, smoothed
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> None:
+        """Start the background inference loop on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and not self._worker.done() and self._loop is loop:
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._server_loop())
+        logger.info(
+            f"Inference batcher started (max_batch_size={self.max_batch_size}, "
+            f"batch_timeout={self.batch_timeout * 1000:.1f}ms)"
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of submitted requests that have not completed yet"""
+        return self._pending
+
+    @property
+    def estimated_queue_delay(self) -> float:
+        """Estimated seconds a new request would wait, from the smoothed service rate"""
+        if not self._service_rate:
+            return 0.0
+        return self._pending / self._service_rate
+
+    @property
+    def overloaded(self) -> bool:
+        return (
+            self._pending >= self.max_pending
+            or self.estimated_queue_delay > self.max_queue_delay
+        )
+
+    async def stop(self) -> None:
+        """Cancel the background inference loop"""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        self._queue = None
+        logger.info("Inference batcher stopped")
+
+    def cancel(self) -> None:
+        """Cancel the background inference loop without waiting for it.
+
+        Unlike stop(), this is safe to call from outside the batcher's event
+        loop, including after that loop has stopped.
+        """
+        worker, loop = self._worker, self._loop
+        self._worker = None
+        if worker is None or worker.done() or loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(worker.cancel)
+        logger.info("Inference batcher cancelled")
+
+    async def submit(
+        self,
+        model_id: str,
+        inputs: Dict[str, Any],
+        parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Queue a prediction and wait for its batched result"""
+        if self.overloaded:
+            raise BatcherOverloadedError(
+                f"Inference queue overloaded ({self._pending} pending, "
+                f"~{self.estimated_queue_delay * 1000:.0f}ms estimated wait)"
+            )
+
+        # Started lazily so apps without a lifespan (e.g. tests) still work
+        self.start()
+        future = self._loop.create_future()
+        self._pending += 1
+        try:
+            await self._queue.put(InferenceRequest(model_id, inputs, parameters, future))
+            return await future
+        finally:
+            self._pending -= 1
+
+    async def _server_loop(self) -> None:
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.batch_timeout
+
+            while len(batch) < self.max_batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            started = loop.time()
+            await self._dispatch(batch)
+            self._update_service_rate(len(batch), loop.time() - started)
+
+    def _update_service_rate(self, batch_size: int, elapsed: float) -> None:
+        if elapsed <= 0:
+            return
+        rate = batch_size / elapsed
+        if self._service_rate is None:
+            self._service_rate = rate
+        else:
+            self._service_rate += _RATE_EMA_ALPHA * (rate - self._service_rate)
+
+    async def _dispatch(self, batch: List[InferenceRequest]) -> None:
+        groups: Dict[Tuple[str, Hashable], List[InferenceRequest]] = {}
+        for request in batch:
+            groups.setdefault(_batch_key(request), []).append(request)
+
+        for (model_id, _), requests in groups.items():
+            logger.debug("Dispatching batch of %d for model %s", len(requests), model_id)
+            try:
+                outputs = await self.model_manager.predict_batch(
+                    model_id,
+                    [r.inputs for r in requests],
+                    [r.parameters for r in requests]
+                )
+            except Exception as e:
+                for request in requests:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+
+            if len(outputs) != len(requests):
+                # Outputs cannot be matched to callers, so fail the whole group
+                # rather than let zip() leave some futures pending forever
+                error = RuntimeError(
+                    f"Model {model_id} returned {len(outputs)} outputs for a batch of {len(requests)}"
+                )
+                for request in requests:
+                    if not request.future.done():
+                        request.future.set_exception(error)
+                continue
+
+            for request, output in zip(requests, outputs):
+                if not request.future.done():
+                    request.future.set_result(output)
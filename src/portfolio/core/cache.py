@@ -1,111 +1,221 @@
 # src/portfolio/core/cache.py
-from typing import Optional, Dict, Any, NamedTuple
+from typing import Optional, Dict, Any, Iterable, List, Tuple, Union
 from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+import operator
 import time
 import logging
+from .policies import CACHE_POLICIES, CachePolicy
+from ..utils.compat import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
-class CacheEntry(NamedTuple):
+# Sentinel for a single-probe miss check in get()
+_MISSING = object()
+
+# Upper bound on recycled CacheEntry objects kept for reuse after eviction
+_ENTRY_POOL_SIZE = 64
+
+
+@dataclass(**DATACLASS_SLOTS)
+class CacheEntry:
     value: Any
     size_bytes: int
-    last_accessed: float
+    last_used_at: float  # time.monotonic() of the last put or hit
+    access_count: int = 0  # hits since the entry was put
+    hits: int = 0  # saturating hit counter used by the 'counter' policy
+    referenced: bool = False  # visited bit used by the 'clock' and 'sieve' policies
 
 class LRUCache:
-    def __init__(self, max_size_bytes: int, soft_limit_bytes: Optional[int] = None):
+    def __init__(
+        self,
+        max_size_bytes: int,
+        soft_limit_bytes: Optional[int] = None,
+        policy: Union[str, CachePolicy] = 'lru'
+    ):
+        if isinstance(policy, str):
+            policy_cls = CACHE_POLICIES.get(policy)
+            if policy_cls is None:
+                raise ValueError(f"Unknown cache policy {policy!r}, expected one of {tuple(CACHE_POLICIES)}")
+            policy = policy_cls()
+
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._policy = policy
+        policy.bind(self._cache, max_size_bytes)
+        # Bound once so a hit costs a single call into the policy
+        self._on_hit = policy.on_hit
         self._max_size_bytes = max_size_bytes
-        self._soft_limit_bytes = soft_limit_bytes or (max_size_bytes * 0.85)
+        self._soft_limit_bytes = soft_limit_bytes or int(max_size_bytes * 0.85)
         self._current_size_bytes = 0
-        print(f"Cache initialized: max={max_size_bytes}, soft={self._soft_limit_bytes}")
+        # put() only enforces the hard limit; going over the soft limit flags
+        # the cache for a drain() that the owner runs off the put path
+        self._needs_drain = False
+        self._last_inserted: Optional[str] = None  # never drained: it was just loaded
+        # Wall-clock times are derived from the monotonic stamps via a fixed offset
+        self._wall_offset = time.time() - time.monotonic()
+        self._free_entries: List[CacheEntry] = []
+        logger.debug(
+            "Cache initialized: max=%d, soft=%d, policy=%s",
+            max_size_bytes, self._soft_limit_bytes, policy.name or type(policy).__name__
+        )
 
     def get(self, key: str) -> Optional[Any]:
-        if key not in self._cache:
+        entry = self._cache.get(key, _MISSING)
+        if entry is _MISSING:
             return None
 
-        # Move to end (most recently used)
-        entry = self._cache.pop(key)
-        self._cache[key] = CacheEntry(
-            entry.value,
-            entry.size_bytes,
-            time.time()
-        )
+        self._on_hit(key, entry)
+
+        # Update the entry in place. Bookkeeping is per entry: a shared
+        # sampling counter can phase-lock with the access pattern and starve
+        # one entry's updates entirely
+        entry.last_used_at = time.monotonic()
+        entry.access_count += 1
         return entry.value
 
+    def mget(self, keys: Iterable[str]) -> Dict[str, Optional[Any]]:
+        """Look up several keys at once; each hit counts as a use, as with get()"""
+        get = self.get
+        return {key: get(key) for key in keys}
+
     @property
     def available_space(self):
         return self._max_size_bytes - self._current_size_bytes
 
     def put(self, key: str, value: Any, size_bytes: int) -> None:
-        print(f"\nPutting {key} (size={size_bytes})")
-        print(f"Before put: current_size={self._current_size_bytes}, max={self._max_size_bytes}")
+        # Sizes are whole bytes (a float raises TypeError), so the running
+        # total stays exact integer arithmetic
+        size_bytes = operator.index(size_bytes)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Putting %s (size=%d)", key, size_bytes)
+            logger.debug("Before put: current_size=%d, max=%d", self._current_size_bytes, self._max_size_bytes)
 
         if size_bytes > self._max_size_bytes:
             raise ValueError(f"Item size {size_bytes} exceeds cache maximum {self._max_size_bytes}")
 
-        # If key exists, remove it first
-        if key in self._cache:
-            old_entry = self._cache.pop(key)
+        old_entry = self._cache.get(key)
+        if old_entry is not None and old_entry.size_bytes == size_bytes:
+            # Same-size update: swap the value in place, with no eviction or
+            # size bookkeeping; the policy sees it as a use of the entry
+            old_entry.value = value
+            old_entry.last_used_at = time.monotonic()
+            self._on_hit(key, old_entry)
+            return
+
+        # If key exists with a different size, remove it first
+        if old_entry is not None:
+            del self._cache[key]
+            self._policy.on_remove(key)
             self._current_size_bytes -= old_entry.size_bytes
-            print(f"Removed existing entry for {key}, freed {old_entry.size_bytes}")
+            if debug:
+                logger.debug("Removed existing entry for %s, freed %d", key, old_entry.size_bytes)
+            self._release_entry(old_entry)
 
-        # Calculate required space
-        required_space = size_bytes
-
-        # If we need more space, evict items
-        if required_space > self.available_space:
-            print(f"Need to free {required_space - self.available_space} bytes")
-            self._make_space(required_space, key)
+        # The key itself was popped above, so it can never be chosen as a victim
+        needed = self._current_size_bytes + size_bytes - self._max_size_bytes
+        if needed > 0:
+            if debug:
+                logger.debug("Need to free %d bytes", needed)
+            self._evict(needed, debug)
 
         # Add new entry
-        self._cache[key] = CacheEntry(value, size_bytes, time.time())
+        entry = self._new_entry(value, size_bytes)
+        self._cache[key] = entry
+        self._policy.on_insert(key, entry)
+        self._last_inserted = key
         self._current_size_bytes += size_bytes
+        if self._current_size_bytes > self._soft_limit_bytes:
+            self._needs_drain = True
 
-        print(f"After put: current_size={self._current_size_bytes}, max={self._max_size_bytes}")
-        self._print_cache_state()
-
-    def _make_space(self, needed_bytes: int, exclude_key: Optional[str] = None) -> None:
-        """Make space for needed_bytes by evicting least recently used items first"""
-        to_free = needed_bytes - self.available_space
+        if debug:
+            logger.debug("After put: current_size=%d, max=%d", self._current_size_bytes, self._max_size_bytes)
 
-        if to_free <= 0:
-            return  # No need to free up space
-
-        # Get items sorted by last access time (sorted() returns ascending order - oldest first)
-        items = sorted(self._cache.items(), key=lambda x: x[1].last_accessed)
-
-        # Track how much space we've freed
-        freed_space = 0
-        to_remove = []
-
-        # Collect items to remove until we have enough space
-        for key, entry in items:
-            if key == exclude_key:
-                continue
-            to_remove.append(key)
-            freed_space += entry.size_bytes
-            if freed_space >= to_free:
-                break
-
-        # Remove the items
-        for key in to_remove:
-            entry = self._cache.pop(key)
-            self._current_size_bytes -= entry.size_bytes
-            print(f"Evicted {key}, freed {entry.size_bytes} bytes")
+    @property
+    def needs_drain(self) -> bool:
+        """Whether a put has taken the cache over its soft limit since the last drain"""
+        return self._needs_drain
+
+    def drain(self) -> int:
+        """Evict down to the soft limit and return the bytes freed. The most
+        recently inserted entry is never a victim, since the load that put it
+        is about to use it; a lone item above the soft limit stays cached."""
+        self._needs_drain = False
+        excess = self._current_size_bytes - self._soft_limit_bytes
+        freed = 0
+        while freed < excess and len(self._cache) > 1:
+            evicted_key, evicted = self._pop_victim(exclude=self._last_inserted)
+            freed += evicted.size_bytes
+            logger.debug("Drained %s, freed %d bytes", evicted_key, evicted.size_bytes)
+            self._release_entry(evicted)
+        self._current_size_bytes -= freed
+        return freed
+
+    def _evict(self, needed: int, debug: bool) -> None:
+        """Evict victims until at least ``needed`` bytes are freed, settling the size once"""
+        freed = 0
+        while freed < needed:
+            evicted_key, evicted = self._pop_victim()
+            freed += evicted.size_bytes
+            if debug:
+                logger.debug("Evicted %s, freed %d bytes", evicted_key, evicted.size_bytes)
+            self._release_entry(evicted)
+        self._current_size_bytes -= freed
+
+    def _pop_victim(self, exclude: Optional[str] = None) -> Tuple[str, CacheEntry]:
+        """Remove and return the policy's next victim, never ``exclude``"""
+        key = self._policy.select_victim(exclude)
+        return key, self._cache.pop(key)
+
+    def _new_entry(self, value: Any, size_bytes: int) -> CacheEntry:
+        """Reuse a pooled entry if one is available, else allocate"""
+        if not self._free_entries:
+            return CacheEntry(value, size_bytes, time.monotonic())
+
+        entry = self._free_entries.pop()
+        entry.value = value
+        entry.size_bytes = size_bytes
+        entry.last_used_at = time.monotonic()
+        entry.access_count = 0
+        entry.hits = 0
+        entry.referenced = False
+        return entry
+
+    def _release_entry(self, entry: CacheEntry) -> None:
+        """Drop the entry's value and keep the object for reuse"""
+        entry.value = None
+        if len(self._free_entries) < _ENTRY_POOL_SIZE:
+            self._free_entries.append(entry)
 
     def remove(self, key: str) -> None:
-        if key in self._cache:
-            entry = self._cache.pop(key)
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._policy.on_remove(key)
             self._current_size_bytes -= entry.size_bytes
+            self._release_entry(entry)
 
     def clear(self) -> None:
         self._cache.clear()
+        self._policy.clear()
         self._current_size_bytes = 0
+        self._needs_drain = False
+        self._last_inserted = None
+
+    def get_size(self, key: str) -> Optional[int]:
+        """Size recorded for the entry at put(), without touching recency"""
+        entry = self._cache.get(key)
+        return entry.size_bytes if entry is not None else None
 
-    def get_last_access_time(self, key: str) -> Optional[float]:
-        if key in self._cache:
-            return self._cache[key].last_accessed
-        return None
+    def get_last_access_time(self, key: str) -> Optional[datetime]:
+        """Wall-clock time the entry was last stored or used"""
+        timestamp = self.get_last_access_timestamp(key)
+        return datetime.fromtimestamp(timestamp) if timestamp is not None else None
+
+    def get_last_access_timestamp(self, key: str) -> Optional[float]:
+        """Like get_last_access_time, as a unix timestamp"""
+        entry = self._cache.get(key)
+        return self._wall_offset + entry.last_used_at if entry is not None else None
 
     def stats(self) -> Dict[str, Any]:
         return {
@@ -118,8 +228,3 @@ class LRUCache:
     @property
     def count(self) -> int:
         return len(self._cache)
-
-    def _print_cache_state(self) -> None:
-        print("\nCache state:")
-        for key, entry in self._cache.items():
-            print(f"  {key}: size={entry.size_bytes} => {entry}")
@@ -1,7 +1,10 @@
 # src/portfolio/utils/config.py
+import copy
+import os
 import yaml
-from typing import Dict
-from pydantic import BaseModel
+from typing import Any, Dict, Tuple
+from pydantic import BaseModel, Field
+from ..utils.compat import YamlSafeLoader
 
 
 class ModelConfig(BaseModel):
@@ -10,21 +13,51 @@ class ModelConfig(BaseModel):
     memory_estimate: str
     preload: bool = False
     version: str = "1.0.0"
+    dtype: str = "float32"  # float32, float16 or bfloat16 (PyTorch models)
+    input_schema: Dict[str, Any] = Field(default_factory=dict)
+    output_schema: Dict[str, Any] = Field(default_factory=dict)
 
 
 class CacheConfig(BaseModel):
     max_memory: str
     soft_limit: str
     ttl: int = 3600
+    policy: str = "lru"
+
+
+class BatchingConfig(BaseModel):
+    max_batch_size: int = 64
+    batch_timeout_micros: int = 2000
+    max_pending: int = 1024
+    max_queue_delay_ms: float = 1000.0
 
 
 class Config(BaseModel):
     models: Dict[str, ModelConfig]
     cache: CacheConfig
+    batching: BatchingConfig = Field(default_factory=BatchingConfig)
+
+
+# Parsed YAML keyed by absolute path, tagged with the file's (mtime, size)
+_parsed_files: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def read_config_file(path: str) -> Dict[str, Any]:
+    """Parse a YAML config file, reusing the previous parse while the file is unchanged"""
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _parsed_files.get(abs_path)
+    if cached is None or cached[0] != version:
+        with open(abs_path, 'rb') as f:
+            raw_config = yaml.load(f, Loader=YamlSafeLoader)
+        cached = _parsed_files[abs_path] = (version, raw_config)
+
+    # Callers own their copy, so the cached parse is never mutated
+    return copy.deepcopy(cached[1])
 
 
 def load_config(path: str) -> Config:
     """Load and validate configuration"""
-    with open(path) as f:
-        raw_config = yaml.safe_load(f)
-    return Config(**raw_config)
+    return Config(**read_config_file(path))
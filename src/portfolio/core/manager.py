@@ -1,24 +1,35 @@
 # src/portfolio/core/manager.py
-from typing import Optional, Dict, Any, NamedTuple, Set
-from datetime import datetime
+from typing import Optional, Dict, Any, List, Set
+from dataclasses import dataclass
+import asyncio
 import os
-import re
-import yaml
 import logging
 from .cache import LRUCache
-from ..models.loader import PyTorchLoader, TensorFlowLoader
+from .config import read_config_file
+from ..models.loader import ModelLoader, PyTorchLoader, TensorFlowLoader
+from ..models.schemas.model_info import ModelInfo
+from ..utils.compat import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
+class ModelNotLoadedError(ValueError):
+    """Raised when a model is unknown or could not be loaded for inference"""
 
-class ModelInfo(NamedTuple):
-    """Model metadata container"""
+
+_SIZE_SUFFIXES = (('TB', 1 << 40), ('GB', 1 << 30), ('MB', 1 << 20), ('KB', 1 << 10), ('B', 1))
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class ModelEntry:
+    """A model's configuration, parsed once when the manager starts"""
+    type: str  # lowercased
+    path: str  # absolute, resolved against the config location
+    loader: Optional[ModelLoader]
     version: str
-    format: str
+    dtype: str
     input_schema: Dict[str, Any]
     output_schema: Dict[str, Any]
-    memory_usage: int
-    last_used: Optional[datetime]
+    preload: bool
 
 
 class ModelManager:
@@ -51,7 +62,8 @@ class ModelManager:
         # Create the cache instance
         self.cache: LRUCache = LRUCache(
             max_size_bytes=max_size_bytes,
-            soft_limit_bytes=soft_limit_bytes
+            soft_limit_bytes=soft_limit_bytes,
+            policy=self.config['cache'].get('policy', 'lru')
         )
 
         # Initialize model loaders
@@ -60,13 +72,36 @@ class ModelManager:
             'tensorflow': TensorFlowLoader()
         }
 
+        # Parse model configuration once so request paths do a single lookup
+        self._model_entries: Dict[str, ModelEntry] = {
+            model_id: self._parse_model_entry(model_config)
+            for model_id, model_config in self.config['models'].items()
+        }
+
         # Initialize model storage and tracking
         self.models: Dict[str, Any] = {}
         self.model_info: Dict[str, ModelInfo] = {}
         self._active_models: Set[str] = set()
+        # Loads in flight, so concurrent misses (e.g. a request arriving
+        # during preload) share one load instead of each reading the model
+        self._loading: Dict[str, "asyncio.Future[Optional[Any]]"] = {}
 
         logger.info(f"Initialized loaders for: {', '.join(self.loaders.keys())}")
 
+    def _parse_model_entry(self, model_config: Dict[str, Any]) -> ModelEntry:
+        """Build the parsed entry for one model's configuration"""
+        model_type = model_config['type'].lower()
+        return ModelEntry(
+            type=model_type,
+            path=self._resolve_path(model_config['path']),
+            loader=self.loaders.get(model_type),
+            version=model_config.get('version', '1.0.0'),
+            dtype=model_config.get('dtype', 'float32'),
+            input_schema=model_config.get('input_schema') or {},
+            output_schema=model_config.get('output_schema') or {},
+            preload=bool(model_config.get('preload', False))
+        )
+
     def _resolve_path(self, path: str) -> str:
         """Resolve a path relative to the config file location"""
         if os.path.isabs(path):
@@ -75,25 +110,19 @@ class ModelManager:
 
     async def _load_model(self, model_id: str) -> Optional[Any]:
         """Load a model from storage."""
-        if model_id not in self.config['models']:
+        entry = self._model_entries.get(model_id)
+        if entry is None:
             logger.warning(f"Model {model_id} not found in configuration")
             return None
 
         try:
-            model_config = self.config['models'][model_id]
-            model_type = model_config['type'].lower()
-
-            # Resolve the model path
-            model_path = self._resolve_path(model_config['path'])
-            logger.info(f"Resolved model path: {model_path}")
-
-            loader = self.loaders.get(model_type)
+            loader = entry.loader
             if loader is None:
-                logger.error(f"No loader available for model type: {model_type}")
+                logger.error(f"No loader available for model type: {entry.type}")
                 return None
 
-            logger.info(f"Loading model {model_id} using {model_type} loader")
-            model = await loader.load(model_path)
+            logger.info(f"Loading model {model_id} from {entry.path} using {entry.type} loader")
+            model = await loader.load(entry.path, dtype=entry.dtype)
 
             if model is None:
                 logger.error(f"Failed to load model {model_id}")
@@ -104,6 +133,9 @@ class ModelManager:
 
             # Store in cache and track as active
             self.cache.put(model_id, model, memory_usage)
+            if self.cache.needs_drain:
+                # Trim back to the soft limit after this request, not during it
+                asyncio.get_running_loop().call_soon(self._drain_cache)
             self._active_models.add(model_id)
             logger.info(f"Model {model_id} added to active models. Total active: {len(self._active_models)}")
 
@@ -113,13 +145,31 @@ class ModelManager:
             logger.error(f"Failed to load model {model_id}: {str(e)}")
             return None
 
+    def _drain_cache(self) -> None:
+        """Evict models until the cache is back under its soft limit"""
+        if not self.cache.needs_drain:
+            return
+        freed = self.cache.drain()
+        if freed:
+            logger.info(f"Cache over soft limit, evicted {freed:,} bytes")
+
+    def get_model_entry(self, model_id: str) -> Optional[ModelEntry]:
+        """Parsed configuration of a model, or None if it is not configured"""
+        return self._model_entries.get(model_id)
+
     async def get_model(self, model_id: str) -> Optional[Any]:
         """Get a model, loading it if necessary."""
-        logger.debug(f"Getting model: {model_id}")
+        logger.debug("Getting model: %s", model_id)
         model = self.cache.get(model_id)
         if model is None:
-            logger.info(f"Model {model_id} not in cache, loading...")
-            model = await self._load_model(model_id)
+            load = self._loading.get(model_id)
+            if load is None:
+                logger.info(f"Model {model_id} not in cache, loading...")
+                load = asyncio.ensure_future(self._load_model(model_id))
+                self._loading[model_id] = load
+                load.add_done_callback(lambda _: self._loading.pop(model_id, None))
+            # Shielded so one caller's cancellation does not abort the shared load
+            model = await asyncio.shield(load)
         elif model_id not in self._active_models:
             # Model was in cache but not marked as active
             self._active_models.add(model_id)
@@ -135,51 +185,81 @@ class ModelManager:
         """Perform model inference."""
         model = await self.get_model(model_id)
         if model is None:
-            raise ValueError(f"Model {model_id} not found")
-
-        model_config = self.config['models'][model_id]
-        model_type = model_config['type'].lower()
-        loader = self.loaders.get(model_type)
+            raise ModelNotLoadedError(f"Model {model_id} failed to load")
 
+        entry = self._model_entries[model_id]
+        loader = entry.loader
         if loader is None:
-            raise ValueError(f"No loader available for model type: {model_type}")
+            raise ValueError(f"No loader available for model type: {entry.type}")
 
-        logger.debug(f"Running prediction for model {model_id}")
+        logger.debug("Running prediction for model %s", model_id)
         return await loader.predict(model, inputs)
 
-    def _parse_size(self, size_str: str) -> int:
+    async def predict_batch(
+        self,
+        model_id: str,
+        inputs_list: List[Dict[str, Any]],
+        params_list: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Perform model inference on a batch of inputs with a single model call."""
+        model = await self.get_model(model_id)
+        if model is None:
+            raise ModelNotLoadedError(f"Model {model_id} failed to load")
+
+        entry = self._model_entries[model_id]
+        loader = entry.loader
+        if loader is None:
+            raise ValueError(f"No loader available for model type: {entry.type}")
+
+        logger.debug("Running batched prediction of %d for model %s", len(inputs_list), model_id)
+        return await loader.predict_batch(model, inputs_list)
+
+    async def preload_models(self, warmup_iterations: int = 3) -> None:
+        """Load and warm up every model configured with preload: true."""
+        for model_id, entry in self._model_entries.items():
+            if not entry.preload:
+                continue
+
+            model = await self.get_model(model_id)
+            if model is None:
+                logger.warning(f"Failed to preload model {model_id}")
+                continue
+
+            input_shape = entry.input_schema.get('shape')
+            if not input_shape:
+                logger.info(f"Preloaded model {model_id} (no input shape configured, skipping warm-up)")
+                continue
+
+            await entry.loader.warmup(model, tuple(input_shape), warmup_iterations)
+            logger.info(f"Preloaded and warmed up model {model_id}")
+
+    @staticmethod
+    def _parse_size(size_str: str) -> int:
         """Convert size string (e.g., '1GB') to bytes."""
         if not isinstance(size_str, str):
             raise ValueError(f"Size must be a string, got {type(size_str)}")
 
-        size_str = str(size_str).strip()
-
-        match = re.match(r'^(\d+(?:\.\d+)?)\s*([KMGT]?B)$', size_str.upper())
-        if not match:
-            raise ValueError(f"Invalid size format: {size_str}. Expected format: '1GB', '100MB', etc.")
+        size_str = size_str.strip()
+        upper = size_str.upper()
 
-        number, unit = match.groups()
-        multipliers = {
-            'B': 1,
-            'KB': 1024,
-            'MB': 1024**2,
-            'GB': 1024**3,
-            'TB': 1024**4
-        }
+        # Multi-letter suffixes are checked before the bare 'B'
+        for suffix, multiplier in _SIZE_SUFFIXES:
+            if upper.endswith(suffix):
+                number = upper[:-len(suffix)].rstrip()
+                integer, dot, fraction = number.partition('.')
+                if integer.isdecimal() and (not dot or fraction.isdecimal()):
+                    return int(float(number) * multiplier)
+                break
 
-        try:
-            return int(float(number) * multipliers[unit])
-        except (ValueError, KeyError) as e:
-            raise ValueError(f"Invalid size format: {size_str}") from e
+        raise ValueError(f"Invalid size format: {size_str}. Expected format: '1GB', '100MB', etc.")
 
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         logger.info(f"Loading config from: {config_path}")
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                logger.debug(f"Loaded config: {config}")
-                return config
+            config = read_config_file(config_path)
+            logger.debug("Loaded config: %s", config)
+            return config
         except Exception as e:
             logger.error(f"Failed to load config from {config_path}: {str(e)}")
             raise
@@ -188,6 +268,9 @@ class ModelManager:
         """
         Retrieve metadata information for a specific model.
 
+        Metadata comes from the parsed configuration and the cache, so this
+        never loads the model; memory usage is 0 while it is not cached.
+
         Args:
             model_id (str): The unique identifier for the model
 
@@ -197,43 +280,27 @@ class ModelManager:
         Raises:
             ValueError: If the model_id is invalid or not found in configuration
         """
-        logger.debug(f"Getting model info for: {model_id}")
+        logger.debug("Getting model info for: %s", model_id)
 
         # Check if model exists in configuration
-        if model_id not in self.config['models']:
+        entry = self._model_entries.get(model_id)
+        if entry is None:
             logger.warning(f"Model {model_id} not found in configuration")
             return None
 
-        model_config = self.config['models'][model_id]
-
-        try:
-            # Get the model to ensure memory usage is accurate
-            model = await self.get_model(model_id)
-            if model is None:
-                return None
-
-            # Get the appropriate loader
-            model_type = model_config['type'].lower()
-            loader = self.loaders.get(model_type)
-
-            if loader is None:
-                logger.error(f"No loader available for model type: {model_type}")
-                return None
-
-            # Gather model information
-            return ModelInfo(
-                version=model_config.get('version', '1.0.0'),
-                format=model_type,
-                input_schema=model_config.get('input_schema', {}),
-                output_schema=model_config.get('output_schema', {}),
-                memory_usage=loader.get_memory_usage(model),
-                last_used=self.cache.get_last_access_time(model_id)
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to get model info for {model_id}: {str(e)}")
+        if entry.loader is None:
+            logger.error(f"No loader available for model type: {entry.type}")
             return None
 
+        return ModelInfo(
+            version=entry.version,
+            format=entry.type,
+            input_schema=entry.input_schema,
+            output_schema=entry.output_schema,
+            memory_usage=self.cache.get_size(model_id) or 0,
+            last_used=self.cache.get_last_access_time(model_id)
+        )
+
     @property
     def active_model_count(self) -> int:
         """Get count of currently active models."""
@@ -0,0 +1,351 @@
+# src/portfolio/core/policies.py
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Type
+
+if TYPE_CHECKING:
+    from .cache import CacheEntry
+
+# Saturation point of the 'counter' policy's per-entry hit counter
+_COUNTER_MAX = 255
+
+# 2Q sizing, as fractions of the cache's byte budget: new entries wait in a
+# FIFO of up to _2Q_IN_FRACTION, and evicted ones are remembered (keys only)
+# up to _2Q_OUT_FRACTION
+_2Q_IN_FRACTION = 0.25
+_2Q_OUT_FRACTION = 0.5
+
+
+def _ratio(numerator: int, denominator: int) -> float:
+    """ARC's adaptation step multiplier, at least 1 (and safe for zero-byte entries)"""
+    return max(1.0, numerator / denominator) if denominator else 1.0
+
+
+def _first_key(queue: "OrderedDict[str, object]", exclude: Optional[str]) -> Optional[str]:
+    """Oldest key of an ordered queue other than ``exclude``, or None"""
+    for key in queue:
+        if key != exclude:
+            return key
+    return None
+
+
+class CachePolicy(ABC):
+    """
+    Decides which entry LRUCache evicts.
+
+    The cache owns the entries and the byte accounting; a policy only sees
+    the hooks below. ``entries`` is the cache's OrderedDict in insertion
+    order (new entries are appended), which policies may reorder or read.
+    A policy instance serves a single cache.
+    """
+
+    name = ""
+
+    def bind(self, entries: "OrderedDict[str, CacheEntry]", max_size_bytes: int) -> None:
+        """Attach the policy to a cache's entry table"""
+        self.entries = entries
+        self.max_size_bytes = max_size_bytes
+
+    def on_insert(self, key: str, entry: "CacheEntry") -> None:
+        """Called after a new entry has been appended to ``entries``"""
+
+    def on_hit(self, key: str, entry: "CacheEntry") -> None:
+        """Called on every cache hit"""
+
+    def on_remove(self, key: str) -> None:
+        """Called when an entry is removed or replaced (not for evictions)"""
+
+    @abstractmethod
+    def select_victim(self, exclude: Optional[str] = None) -> str:
+        """Key of the entry to evict next, never ``exclude``; the cache pops
+        it afterwards and guarantees some other entry exists"""
+
+    def clear(self) -> None:
+        """Forget all state; called when the cache is cleared"""
+
+
+class LRUPolicy(CachePolicy):
+    """Exact recency order: hits move the entry to the tail, the head is evicted"""
+
+    name = "lru"
+
+    def on_hit(self, key: str, entry: "CacheEntry") -> None:
+        # O(1) C-level relink to the most recently used end
+        self.entries.move_to_end(key)
+
+    def select_victim(self, exclude: Optional[str] = None) -> str:
+        return _first_key(self.entries, exclude)
+
+
+class CounterPolicy(CachePolicy):
+    """Saturating per-entry hit counters; the least-hit entry is evicted"""
+
+    name = "counter"
+
+    def on_hit(self, key: str, entry: "CacheEntry") -> None:
+        if entry.hits >= _COUNTER_MAX:
+            # Halve every counter once one saturates, so old popularity decays
+            for other in self.entries.values():
+                other.hits >>= 1
+        entry.hits += 1
+
+    def select_victim(self, exclude: Optional[str] = None) -> str:
+        # Ties go to the oldest insertion
+        return min(
+            (item for item in self.entries.items() if item[0] != exclude),
+            key=lambda item: item[1].hits
+        )[0]
+
+
+class ClockPolicy(CachePolicy):
+    """
+    CLOCK (second chance): a hit only sets a referenced bit. The entries'
+    head is the hand; a referenced entry loses its bit and moves behind the
+    hand, and the first unreferenced one is evicted.
+    """
+
+    name = "clock"
+
+    def on_hit(self, key: str, entry: "CacheEntry") -> None:
+        entry.referenced = True
+
+    def select_victim(self, exclude: Optional[str] = None) -> str:
+        entries = self.entries
+        while True:
+            key = next(iter(entries))
+            entry = entries[key]
+            if key != exclude and not entry.referenced:
+                return key
+            if key != exclude:
+                entry.referenced = False
+            entries.move_to_end(key)
+
+
+class SievePolicy(CachePolicy):
+    """
+    SIEVE: a hit only sets a visited bit and entries never move. A hand walks
+    from oldest to newest clearing bits, wraps around, and resumes from the
+    victim's newer neighbour on the next eviction. The queue is a doubly
+    linked list of keys, so the hand steps and unlinks in O(1).
+    """
+
+    name = "sieve"
+
+    def bind(self, entries: "OrderedDict[str, CacheEntry]", max_size_bytes: int) -> None:
+        super().bind(entries, max_size_bytes)
+        self.clear()
+
+    def on_insert(self, key: str, entry: "CacheEntry") -> None:
+        newest = self._newest
+        self._older[key] = newest
+        self._newer[key] = None
+        if newest is None:
+            self._oldest = key
+        else:
+            self._newer[newest] = key
+        self._newest = key
+
+    def on_hit(self, key: str, entry: "CacheEntry") -> None:
+        entry.referenced = True
+
+    def on_remove(self, key: str) -> None:
+        if key in self._newer:
+            self._unlink(key)
+
+    def select_victim(self, exclude: Optional[str] = None) -> str:
+        entries = self.entries
+        newer = self._newer
+        key = self._hand if self._hand is not None else self._oldest
+        # Every other entry is unreferenced after one full lap, so this ends
+        while True:
+            if key != exclude:
+                entry = entries[key]
+                if not entry.referenced:
+                    self._hand = key  # unlinking moves it on to the newer neighbour
+                    self._unlink(key)
+                    return key
+                entry.referenced = False
+            following = newer[key]
+            key = following if following is not None else self._oldest
+
+    def _unlink(self, key: str) -> None:
+        older = self._older.pop(key)
+        newer = self._newer.pop(key)
+        if older is None:
+            self._oldest = newer
+        else:
+            self._newer[older] = newer
+        if newer is None:
+            self._newest = older
+        else:
+            self._older[newer] = older
+        if self._hand == key:
+            # Resume from the newer neighbour, wrapping to the oldest entry
+            self._hand = newer
+
+    def clear(self) -> None:
+        self._newer: Dict[str, Optional[str]] = {}
+        self._older: Dict[str, Optional[str]] = {}
+        self._oldest: Optional[str] = None
+        self._newest: Optional[str] = None
+        self._hand: Optional[str] = None
+
+
+class TwoQueuePolicy(CachePolicy):
+    """
+    2Q: new entries enter a FIFO (A1in) where repeat hits do not promote
+    them, so a one-off scan cannot flush the working set. Entries evicted
+    from A1in are remembered by key in A1out; one that is put again while
+    remembered has proven reuse and goes to the LRU main queue (Am).
+    Queue limits are in bytes, as fractions of the cache budget.
+    """
+
+    name = "2q"
+
+    def bind(self, entries: "OrderedDict[str, CacheEntry]", max_size_bytes: int) -> None:
+        super().bind(entries, max_size_bytes)
+        self._in_limit = max_size_bytes * _2Q_IN_FRACTION
+        self._out_limit = max_size_bytes * _2Q_OUT_FRACTION
+        self.clear()
+
+    def on_insert(self, key: str, entry: "CacheEntry") -> None:
+        size = entry.size_bytes
+        ghost_size = self._a1out.pop(key, None)
+        if ghost_size is not None:
+            self._a1out_bytes -= ghost_size
+            self._am[key] = size
+        else:
+            self._a1in[key] = size
+            self._a1in_bytes += size
+
+    def on_hit(self, key: str, entry: "CacheEntry") -> None:
+        if key in self._am:
+            self._am.move_to_end(key)
+
+    def on_remove(self, key: str) -> None:
+        size = self._a1in.pop(key, None)
+        if size is not None:
+            self._a1in_bytes -= size
+        else:
+            self._am.pop(key, None)
+
+    def select_victim(self, exclude: Optional[str] = None) -> str:
+        in_key = _first_key(self._a1in, exclude)
+        main_key = _first_key(self._am, exclude)
+        if in_key is not None and (self._a1in_bytes > self._in_limit or main_key is None):
+            key = in_key
+            size = self._a1in.pop(key)
+            self._a1in_bytes -= size
+            self._a1out[key] = size
+            self._a1out_bytes += size
+            while self._a1out_bytes > self._out_limit:
+                _, ghost_size = self._a1out.popitem(last=False)
+                self._a1out_bytes -= ghost_size
+            return key
+        del self._am[main_key]
+        return main_key
+
+    def clear(self) -> None:
+        self._a1in: "OrderedDict[str, int]" = OrderedDict()
+        self._a1out: "OrderedDict[str, int]" = OrderedDict()
+        self._am: "OrderedDict[str, int]" = OrderedDict()
+        self._a1in_bytes = 0
+        self._a1out_bytes = 0
+
+
+class ARCPolicy(CachePolicy):
+    """
+    ARC (Megiddo & Modha): entries seen once live in T1, entries hit again in
+    T2, and evicted keys are remembered in ghost lists B1/B2. A put that hits
+    a ghost list shifts the target size ``p`` of T1 towards the list that
+    would have kept it. Sizes are weighted in bytes rather than entry counts.
+    """
+
+    name = "arc"
+
+    def bind(self, entries: "OrderedDict[str, CacheEntry]", max_size_bytes: int) -> None:
+        super().bind(entries, max_size_bytes)
+        self.clear()
+
+    def on_insert(self, key: str, entry: "CacheEntry") -> None:
+        size = entry.size_bytes
+        capacity = self.max_size_bytes
+        if key in self._b1:
+            # Recency was undervalued: grow T1's share
+            self._p = min(capacity, self._p + size * _ratio(self._b2_bytes, self._b1_bytes))
+            self._b1_bytes -= self._b1.pop(key)
+            self._t2[key] = size
+            self._t2_bytes += size
+        elif key in self._b2:
+            # Frequency was undervalued: shrink T1's share
+            self._p = max(0.0, self._p - size * _ratio(self._b1_bytes, self._b2_bytes))
+            self._b2_bytes -= self._b2.pop(key)
+            self._t2[key] = size
+            self._t2_bytes += size
+        else:
+            self._t1[key] = size
+            self._t1_bytes += size
+        self._trim_ghosts()
+
+    def on_hit(self, key: str, entry: "CacheEntry") -> None:
+        size = self._t1.pop(key, None)
+        if size is not None:
+            self._t1_bytes -= size
+            self._t2[key] = size
+            self._t2_bytes += size
+        else:
+            self._t2.move_to_end(key)
+
+    def on_remove(self, key: str) -> None:
+        size = self._t1.pop(key, None)
+        if size is not None:
+            self._t1_bytes -= size
+            return
+        size = self._t2.pop(key, None)
+        if size is not None:
+            self._t2_bytes -= size
+
+    def select_victim(self, exclude: Optional[str] = None) -> str:
+        t1_key = _first_key(self._t1, exclude)
+        t2_key = _first_key(self._t2, exclude)
+        if t1_key is not None and (self._t1_bytes > self._p or t2_key is None):
+            key = t1_key
+            size = self._t1.pop(key)
+            self._t1_bytes -= size
+            self._b1[key] = size
+            self._b1_bytes += size
+        else:
+            key = t2_key
+            size = self._t2.pop(key)
+            self._t2_bytes -= size
+            self._b2[key] = size
+            self._b2_bytes += size
+        self._trim_ghosts()
+        return key
+
+    def _trim_ghosts(self) -> None:
+        """Keep T1+B1 within the budget and the whole directory within twice it"""
+        capacity = self.max_size_bytes
+        while self._b1 and self._t1_bytes + self._b1_bytes > capacity:
+            self._b1_bytes -= self._b1.popitem(last=False)[1]
+        total = self._t1_bytes + self._t2_bytes + self._b1_bytes
+        while self._b2 and total + self._b2_bytes > 2 * capacity:
+            self._b2_bytes -= self._b2.popitem(last=False)[1]
+
+    def clear(self) -> None:
+        self._t1: "OrderedDict[str, int]" = OrderedDict()
+        self._t2: "OrderedDict[str, int]" = OrderedDict()
+        self._b1: "OrderedDict[str, int]" = OrderedDict()
+        self._b2: "OrderedDict[str, int]" = OrderedDict()
+        self._t1_bytes = 0
+        self._t2_bytes = 0
+        self._b1_bytes = 0
+        self._b2_bytes = 0
+        self._p = 0.0
+
+
+# Config names for the built-in policies
+CACHE_POLICIES: Dict[str, Type[CachePolicy]] = {
+    policy.name: policy
+    for policy in (LRUPolicy, CounterPolicy, ClockPolicy, SievePolicy, TwoQueuePolicy, ARCPolicy)
+}
@@ -1,28 +1,65 @@
 # src/portfolio/main.py
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from portfolio.api.v1 import router as api_router
+from portfolio.api.dependencies import (
+    init_inference_batcher,
+    init_metrics_collector,
+    init_model_manager,
+)
+from portfolio.api.responses import ORJSONResponse
+import asyncio
 import logging
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    force=True
 )
+logger = logging.getLogger(__name__)
+
+async def warm_up(app: FastAPI) -> None:
+    """Preload and warm up models, then mark the app ready to take traffic"""
+    try:
+        await app.state.model_manager.preload_models()
+    except Exception as e:
+        # Models still load lazily on first use, so serve rather than stay unready
+        logger.error(f"Model preloading failed: {str(e)}")
+    app.state.ready = True
+    logger.info("Model warm-up finished, ready to serve")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown events"""
     # Startup
-    logging.info("Portfolio starting up...")
+    logger.info("Portfolio starting up...")
+    app.state.ready = False
+    app.state.model_manager = init_model_manager()
+    app.state.metrics = init_metrics_collector()
+    metrics_flusher = asyncio.create_task(app.state.metrics.run_flusher())
+    app.state.inference_batcher = init_inference_batcher()
+    app.state.inference_batcher.start()
+    # Warm up in the background so the server is up (and /health reports 503)
+    # while models load, instead of refusing connections until they have
+    warmup = asyncio.create_task(warm_up(app))
     yield
     # Shutdown
-    logging.info("Portfolio shutting down...")
+    logger.info("Portfolio shutting down...")
+    warmup.cancel()
+    with suppress(asyncio.CancelledError):
+        await warmup
+    await app.state.inference_batcher.stop()
+    metrics_flusher.cancel()
+    with suppress(asyncio.CancelledError):
+        await metrics_flusher
 
 app = FastAPI(
     title="Portfolio",
     description="LRU-based ML Model Server",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -1,6 +1,6 @@
 # src/portfolio/models/loader/base.py
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -8,8 +8,8 @@ logger = logging.getLogger(__name__)
 
 class ModelLoader(ABC):
     @abstractmethod
-    async def load(self, path: str) -> Any:
-        """Load a model from the given path"""
+    async def load(self, path: str, dtype: str = "float32") -> Any:
+        """Load a model from the given path, with weights in the given dtype"""
         pass
 
     @abstractmethod
@@ -21,3 +21,11 @@ class ModelLoader(ABC):
     async def predict(self, model: Any, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Run model prediction"""
         pass
+
+    async def predict_batch(self, model: Any, inputs_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run model prediction over a batch of inputs"""
+        return [await self.predict(model, inputs) for inputs in inputs_list]
+
+    async def warmup(self, model: Any, input_shape: Tuple[int, ...], iterations: int) -> None:
+        """Run dummy forward passes so the first real request skips cold paths"""
+        pass
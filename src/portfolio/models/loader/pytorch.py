@@ -1,17 +1,69 @@
+import asyncio
 import os
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 import logging
+import warnings
+import weakref
 import torch
 from .base import ModelLoader
 
 logger = logging.getLogger(__name__)
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _to_output(tensor: Any) -> Any:
+    """Output in a JSON-serializable form: an ndarray (serialized natively by
+    orjson) when numpy is available, nested lists otherwise"""
+    if numpy is not None:
+        return tensor.numpy()
+    return tensor.tolist()
+
+
+# Config names accepted for a model's weight dtype
+DTYPES = {
+    "float32": torch.float32,
+    "float16": torch.float16,
+    "bfloat16": torch.bfloat16,
+}
+
+
+# Batches are padded up to one of these sizes so TorchScript sees a small,
+# stable set of input shapes and the preallocated buffers can be reused
+BATCH_BUCKETS = (8, 16, 32, 64)
+
+
+def configure_threads(workers: int = 1) -> int:
+    """Split CPU cores between worker processes to avoid OpenMP/MKL oversubscription"""
+    num_threads = max(1, (os.cpu_count() or 1) // max(1, workers))
+    torch.set_num_threads(num_threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set once, before any inter-op parallel work has started
+        logger.debug("Inter-op thread count already fixed, leaving unchanged")
+    logger.info(f"Configured torch for {workers} worker(s): {num_threads} intra-op thread(s)")
+    return num_threads
+
 
 class PyTorchLoader(ModelLoader):
-    def __init__(self):
+    def __init__(self, optimized_execution: bool = False, device: str = "cpu"):
         self.torch = torch
+        # The JIT profiling executor's warm-up tax outweighs its speculative
+        # optimizations for small models, so it is disabled by default
+        self.optimized_execution = optimized_execution
+        self.device = torch.device(device)
+        # Reused host buffers, only for the shapes warm-up prepares (the configured
+        # input shape and its batch buckets), so client input cannot grow this
+        self._input_buffers: Dict[Tuple[Any, Tuple[int, ...]], Any] = {}
+        # Weight dtype and footprint of each loaded model, dropped when the model is evicted
+        self._model_dtypes: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
+        self._model_memory: "weakref.WeakKeyDictionary[Any, int]" = weakref.WeakKeyDictionary()
 
-    async def load(self, path: str) -> Any:
+    async def load(self, path: str, dtype: str = "float32") -> Any:
         try:
             # Log absolute path for debugging
             abs_path = os.path.abspath(path)
@@ -21,8 +73,14 @@ class PyTorchLoader(ModelLoader):
                 logger.error(f"Model file not found at: {abs_path}")
                 return None
 
-            model = self.torch.jit.load(abs_path)
-            model.eval()  # Set to evaluation mode
+            torch_dtype = DTYPES.get(dtype)
+            if torch_dtype is None:
+                logger.error(f"Unsupported dtype {dtype!r}, expected one of: {', '.join(DTYPES)}")
+                return None
+
+            # Deserializing and optimizing can take seconds; keep the event loop free
+            model = await asyncio.to_thread(self._load_sync, abs_path, torch_dtype)
+            self._model_dtypes[model] = torch_dtype
             logger.info(f"Successfully loaded PyTorch model from: {abs_path}")
             return model
 
@@ -30,25 +88,150 @@ class PyTorchLoader(ModelLoader):
             logger.error(f"Failed to load PyTorch model from {path}: {str(e)}")
             return None
 
+    def _load_sync(self, abs_path: str, dtype: Any) -> Any:
+        model = self.torch.jit.load(abs_path, map_location=self.device)
+        model.eval()  # Set to evaluation mode (required for frozen/optimized graphs too)
+        if dtype != self.torch.float32:
+            # Cast before freezing, which folds the weights into graph constants
+            model = model.to(dtype)
+        # Sized before freezing, while weights and buffers are still enumerable
+        memory = self._tensor_memory(model)
+        model = self._optimize(model)
+        self._model_memory[model] = memory
+        return model
+
+    def _dtype(self, model: Any) -> Any:
+        return self._model_dtypes.get(model, self.torch.float32)
+
+    def _optimize(self, model: Any) -> Any:
+        """Freeze and optimize a scripted model once so every forward benefits"""
+        try:
+            with warnings.catch_warnings():
+                # Both are deprecated in favour of torch.compile on recent releases
+                warnings.simplefilter("ignore", FutureWarning)
+                model = self.torch.jit.freeze(model)
+                model = self.torch.jit.optimize_for_inference(model)
+        except Exception as e:
+            # Artifacts that cannot be frozen (e.g. already optimized) run as loaded
+            logger.debug("Skipping TorchScript freeze/optimize: %s", e)
+        return model
+
     def get_memory_usage(self, model: Any) -> int:
+        memory = self._model_memory.get(model)
+        if memory is not None:
+            return memory
+        return self._tensor_memory(model)
+
+    def _tensor_memory(self, model: Any) -> int:
+        """Bytes held by a model's parameters and buffers (e.g. BatchNorm running stats)"""
         try:
-            return sum(p.numel() * p.element_size() for p in model.parameters())
+            memory = sum(t.numel() * t.element_size() for t in model.parameters())
+            memory += sum(t.numel() * t.element_size() for t in model.buffers())
+            if memory == 0 and hasattr(model, 'graph'):
+                # Frozen TorchScript modules fold their weights into graph constants
+                memory = self._graph_constant_memory(model.graph)
+            return memory
         except Exception as e:
             logger.error(f"Failed to calculate model memory usage: {str(e)}")
             return 0
 
-    async def predict(self, model: Any, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        try:
-            # Convert input data to tensor
-            input_data = inputs.get('data', [])
-            input_tensor = self.torch.tensor(input_data, dtype=self.torch.float32)
+    def _graph_constant_memory(self, graph: Any) -> int:
+        memory = 0
+        for node in graph.nodes():
+            if node.kind() == 'prim::Constant' and isinstance(node.output().type(), self.torch._C.TensorType):
+                tensor = node.output().toIValue()
+                memory += tensor.numel() * tensor.element_size()
+        return memory
+
+    def _forward(self, model: Any, input_tensor: Any) -> Any:
+        with self.torch.inference_mode(), self.torch.jit.optimized_execution(self.optimized_execution):
+            return model(input_tensor)
+
+    async def warmup(self, model: Any, input_shape: Tuple[int, ...], iterations: int) -> None:
+        await asyncio.to_thread(self._warmup_sync, model, input_shape, iterations)
+        logger.info(f"Warmed up PyTorch model for input shape {list(input_shape)}")
 
-            # Run inference
-            with self.torch.no_grad():
-                output = model(input_tensor)
+    def _warmup_sync(self, model: Any, input_shape: Tuple[int, ...], iterations: int) -> None:
+        # Warm the unbatched path and every batch bucket shape the batcher can
+        # produce, allocating the reusable input buffers for them up front
+        dtype = self._dtype(model)
+        shapes = [input_shape] + [(bucket, *input_shape) for bucket in BATCH_BUCKETS]
+        for shape in shapes:
+            dummy = self._input_buffer(shape, dtype, reuse=True).to(self.device, non_blocking=True)
+            for _ in range(iterations):
+                self._forward(model, dummy)
 
-            # Convert output to Python types for JSON serialization
-            return {"output": output.tolist()}
+    async def predict(self, model: Any, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        # Forward passes run in a worker thread (torch releases the GIL), so the
+        # event loop keeps accepting and batching requests meanwhile
+        try:
+            return await asyncio.to_thread(self._predict_sync, model, inputs)
         except Exception as e:
             logger.error(f"Prediction failed: {str(e)}")
             raise
+
+    def _predict_sync(self, model: Any, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        # Convert input data to tensor
+        input_data = inputs.get('data', [])
+        dtype = self._dtype(model)
+        input_tensor = self.torch.tensor(input_data, dtype=dtype)
+        if self.device.type != 'cpu':
+            # Stage through the pinned buffer for an async host-to-device copy
+            buffer = self._input_buffer(tuple(input_tensor.shape), dtype)
+            buffer.copy_(input_tensor)
+            input_tensor = buffer.to(self.device, non_blocking=True)
+
+        # Run inference
+        output = self._forward(model, input_tensor)
+
+        # Convert output for JSON serialization (reduced-precision outputs as float32)
+        return {"output": _to_output(output.cpu().float())}
+
+    def _input_buffer(self, shape: Tuple[int, ...], dtype: Any = torch.float32, reuse: bool = False) -> Any:
+        """Get the preallocated (pinned on CUDA) host buffer for an input shape.
+
+        Only ``reuse=True`` (warm-up) adds a buffer; any other shape gets a
+        transient tensor that is freed after the request.
+        """
+        key = (dtype, shape)
+        buffer = self._input_buffers.get(key)
+        if buffer is None:
+            if not reuse:
+                return self.torch.zeros(shape, dtype=dtype)
+            buffer = self.torch.zeros(
+                shape,
+                dtype=dtype,
+                pin_memory=self.device.type == 'cuda'
+            )
+            self._input_buffers[key] = buffer
+        return buffer
+
+    async def predict_batch(self, model: Any, inputs_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if len(inputs_list) == 1:
+            return [await self.predict(model, inputs_list[0])]
+
+        try:
+            return await asyncio.to_thread(self._predict_batch_sync, model, inputs_list)
+        except Exception as e:
+            # Models traced for a fixed input shape may not accept a batch dimension
+            logger.warning(f"Batched prediction failed, falling back to per-item: {str(e)}")
+            return await super().predict_batch(model, inputs_list)
+
+    def _predict_batch_sync(self, model: Any, inputs_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        dtype = self._dtype(model)
+        batch_tensor = self.torch.tensor(
+            [inputs.get('data', []) for inputs in inputs_list],
+            dtype=dtype
+        )
+
+        # Copy into the reused [bucket, ...] buffer for one forward pass
+        batch_size = len(inputs_list)
+        bucket = next((b for b in BATCH_BUCKETS if b >= batch_size), batch_size)
+        buffer = self._input_buffer((bucket, *batch_tensor.shape[1:]), dtype)
+        buffer[:batch_size].copy_(batch_tensor)
+
+        outputs = self._forward(model, buffer.to(self.device, non_blocking=True))
+        # Copy so outputs never alias the reused input buffer
+        outputs = _to_output(outputs[:batch_size].to("cpu", self.torch.float32, copy=True))
+
+        return [{"output": output} for output in outputs]
@@ -5,25 +5,34 @@ from .base import ModelLoader
 
 logger = logging.getLogger(__name__)
 
+_UNRESOLVED = object()
+
 
 class TensorFlowLoader(ModelLoader):
     def __init__(self):
-        try:
-            import tensorflow as tf
-            self.tf = tf
-        except ImportError:
-            logger.warning("TensorFlow not installed")
-            self.tf = None
+        # TensorFlow takes seconds to import, so it is only imported the first
+        # time a TensorFlow model is actually used
+        self._tf = _UNRESOLVED
 
-    async def load(self, path: str) -> Any:
-        if self.tf is None:
-            return None
+    @property
+    def tf(self) -> Any:
+        if self._tf is _UNRESOLVED:
             try:
-                import tensorflow.saved_model as saved_model
-                return saved_model.load(path)
+                import tensorflow as tf
+                self._tf = tf
             except ImportError:
-                logger.error("Could not import tensorflow.saved_model")
-                return None
+                logger.warning("TensorFlow not installed")
+                self._tf = None
+        return self._tf
+
+    async def load(self, path: str, dtype: str = "float32") -> Any:
+        if self.tf is None:
+            return None
+        try:
+            return self.tf.saved_model.load(path)
+        except Exception as e:
+            logger.error(f"Failed to load TensorFlow model from {path}: {str(e)}")
+            return None
 
     def get_memory_usage(self, model: Any) -> int:
         if self.tf is None:
@@ -1,5 +1,5 @@
 # src/portfolio/models/registry.py
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 import logging
 
@@ -10,22 +10,45 @@ class ModelRegistry:
     """Manages model registration and status tracking"""
 
     def __init__(self):
-        self._models: Dict[str, dict] = {}
+        # Attributes are stored column-wise; _index maps model_id to a row
+        self._index: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._formats: List[str] = []
+        self._loaded: List[bool] = []
+        self._last_used: List[Optional[datetime]] = []
+        self._memory: List[str] = []
 
     def register_model(self, model_id: str, format: str):
         """Register a new model with the registry"""
-        self._models[model_id] = {
-            "format": format,
-            "loaded": False,
-            "last_used": None,
-            "memory_usage": "0MB"
-        }
+        row = self._index.get(model_id)
+        if row is not None:
+            # Re-registering resets the model's status in place
+            self._formats[row] = format
+            self._loaded[row] = False
+            self._last_used[row] = None
+            self._memory[row] = "0MB"
+            return
+
+        self._index[model_id] = len(self._ids)
+        self._ids.append(model_id)
+        self._formats.append(format)
+        self._loaded.append(False)
+        self._last_used.append(None)
+        self._memory.append("0MB")
 
     def get_all_models(self) -> List[dict]:
         """Retrieve all registered models with their current status"""
         return [
-            {"model_id": k, **v}
-            for k, v in self._models.items()
+            {
+                "model_id": model_id,
+                "format": format,
+                "loaded": loaded,
+                "last_used": last_used,
+                "memory_usage": memory_usage
+            }
+            for model_id, format, loaded, last_used, memory_usage in zip(
+                self._ids, self._formats, self._loaded, self._last_used, self._memory
+            )
         ]
 
 
@@ -1,8 +1,11 @@
+from dataclasses import dataclass
 from datetime import datetime
-from typing import NamedTuple, Dict, Optional, Any
+from typing import Dict, Optional, Any
+from ...utils.compat import DATACLASS_SLOTS
 
 
-class ModelInfo(NamedTuple):
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class ModelInfo:
     """Model metadata container"""
     version: str
     format: str
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional, Union
 
 
 @dataclass
@@ -7,6 +8,6 @@ class ModelSummary:
     model_id: str
     status: str  # "loaded", "unloaded", "error"
     format: str  # "pytorch", "tensorflow", etc
-    memory_usage: str
-    last_used: str
+    memory_usage: Union[int, str]  # bytes, or e.g. "12.3 MB" when humanized
+    last_used: Optional[Union[float, str]]  # unix timestamp, or e.g. "2 minutes ago"
     is_loaded: bool
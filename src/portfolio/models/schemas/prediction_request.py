@@ -1,5 +1,14 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
+from typing_extensions import Annotated, TypedDict
+
+
+class InferenceInputs(TypedDict):
+    """Model inputs; ``data`` is required, as a flat, non-empty list of floats"""
+    # Set directly rather than with @with_config, which needs pydantic >= 2.7
+    __pydantic_config__ = ConfigDict(extra='allow')  # type: ignore[misc]
+
+    data: Annotated[List[float], Field(min_length=1)]
 
 
 class PredictionRequest(BaseModel):
@@ -7,11 +16,13 @@ class PredictionRequest(BaseModel):
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
-                "inputs": {"text": "Sample input text"},
+                "inputs": {"data": [1.0, 2.0]},
                 "parameters": {"temperature": 0.7}
             }
         }
     )
 
-    inputs: Dict[str, Any] = Field(..., description="Model input data")
-    parameters: Optional[Dict[str, Any]] = Field(default={}, description="Optional inference parameters")
+    # A TypedDict validates in pydantic-core but stays a plain dict, so
+    # downstream code keeps using inputs['data']
+    inputs: InferenceInputs = Field(..., description="Model input data")
+    parameters: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Optional inference parameters")
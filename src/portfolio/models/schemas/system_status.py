@@ -5,6 +5,9 @@ class SystemStatus(BaseModel):
     """System-wide status information"""
     active_models: int
     total_memory_usage: str
+    total_memory_bytes: int = 0
     cache_utilization: float
     healthy: bool
     uptime: str
+    queue_depth: int = 0
+    estimated_queue_delay_ms: float = 0.0
@@ -0,0 +1,11 @@
+# src/portfolio/utils/compat.py
+import sys
+
+# dataclass(slots=True) requires Python 3.10+; on 3.9 classes keep a __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
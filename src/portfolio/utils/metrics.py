@@ -1,18 +1,35 @@
 # src/portfolio/utils/metrics.py
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from typing import Deque, Dict, Any, Optional, Tuple
+import asyncio
 import time
 import psutil
 import logging
+from .compat import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
+# Number of most recent inference times kept per model for percentiles
+LATENCY_WINDOW = 1024
 
-@dataclass
+# CPU utilisation is a delta between reads, so it is sampled at most this often
+CPU_SAMPLE_INTERVAL = 1.0
+
+# Background aggregation cadence, and the most records folded per tick so a
+# burst never holds the event loop for long
+FLUSH_INTERVAL = 0.1
+FLUSH_MAX_ITEMS = 8192
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ModelMetrics:
     """Track per-model metrics"""
     load_time: float = 0.0
-    inference_times: List[float] = field(default_factory=list)
+    inference_time_sum: float = 0.0  # averaged over request_count
+    # Fixed-size ring of the latest inference times, written at request_count % LATENCY_WINDOW
+    recent_times: array = field(default_factory=lambda: array('d', bytes(8 * LATENCY_WINDOW)))
     memory_usage: int = 0
     request_count: int = 0  # Add explicit request counter
     hits: int = 0
@@ -22,56 +39,89 @@ class ModelMetrics:
 class MetricsCollector:
     """System-wide metrics collection"""
 
-    def __init__(self):
+    def __init__(self, ring_capacity: int = 65536):
         self.model_metrics: Dict[str, ModelMetrics] = {}
         self.start_time = time.time()
         self._total_requests = 0  # Add global request counter
+        # Recent (model_id, duration) records awaiting aggregation
+        self._ring: Deque[Tuple[str, float]] = deque(maxlen=ring_capacity)
+        # One process handle for the collector's lifetime instead of one per call
+        self._process = psutil.Process()
+        self._cpu_sample: Tuple[float, float] = (float('-inf'), 0.0)  # (taken_at, percent)
         logger.info("MetricsCollector initialized")
 
     def record_inference(self, model_id: str, duration: float):
-        """Record a model inference"""
-        try:
-            if model_id not in self.model_metrics:
-                self.model_metrics[model_id] = ModelMetrics()
-
-            metrics = self.model_metrics[model_id]
-            metrics.inference_times.append(duration)
-            metrics.request_count += 1
-            self._total_requests += 1
+        """Record a model inference (buffered; aggregated on the next flush)"""
+        self._ring.append((model_id, duration))
+        self._total_requests += 1
 
-            logger.debug(f"Recorded inference for {model_id}: duration={duration:.3f}s, "
-                        f"total_requests={self._total_requests}")
+    def flush(self, max_items: Optional[int] = None) -> None:
+        """Fold buffered inference records (at most max_items, if given) into the per-model metrics"""
+        ring = self._ring
+        model_metrics = self.model_metrics
+        count = len(ring) if max_items is None else min(len(ring), max_items)
+        try:
+            for _ in range(count):
+                model_id, duration = ring.popleft()
+                metrics = model_metrics.get(model_id)
+                if metrics is None:
+                    metrics = model_metrics[model_id] = ModelMetrics()
+                metrics.inference_time_sum += duration
+                metrics.recent_times[metrics.request_count % LATENCY_WINDOW] = duration
+                metrics.request_count += 1
         except Exception as e:
-            logger.error(f"Failed to record inference metrics: {str(e)}")
+            logger.error(f"Failed to aggregate inference metrics: {str(e)}")
+
+    async def run_flusher(self, interval: float = FLUSH_INTERVAL, max_items: int = FLUSH_MAX_ITEMS) -> None:
+        """Periodically aggregate buffered records until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            self.flush(max_items)
 
     def get_request_count(self) -> int:
         """Get total number of requests across all models"""
         return self._total_requests
 
+    def _cpu_percent(self) -> float:
+        now = time.monotonic()
+        taken_at, percent = self._cpu_sample
+        if now - taken_at >= CPU_SAMPLE_INTERVAL:
+            # Non-blocking read of utilisation since the previous call
+            percent = psutil.cpu_percent(interval=None)
+            self._cpu_sample = (now, percent)
+        return percent
+
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get current system metrics"""
         return {
-            'memory_usage': psutil.Process().memory_info().rss,
-            'cpu_percent': psutil.cpu_percent(),
+            # RSS is read fresh so model loads show up immediately
+            'memory_usage': self._process.memory_info().rss,
+            'cpu_percent': self._cpu_percent(),
             'uptime': time.time() - self.start_time,
             'total_requests': self._total_requests
         }
 
     def get_inference_time_avg(self, model_id: str) -> float:
         """Calculate average inference time for a model"""
-        try:
-            if model_id not in self.model_metrics:
-                return 0.0
-            times = self.model_metrics[model_id].inference_times
-            if not times:
-                return 0.0
-            return sum(times) / len(times)
-        except Exception as e:
-            logger.error(f"Failed to calculate average inference time: {str(e)}")
+        self.flush()
+        metrics = self.model_metrics.get(model_id)
+        if metrics is None or not metrics.request_count:
+            return 0.0
+        return metrics.inference_time_sum / metrics.request_count
+
+    def get_inference_time_percentile(self, model_id: str, percentile: float) -> float:
+        """Nearest-rank percentile over the model's most recent inference times"""
+        self.flush()
+        metrics = self.model_metrics.get(model_id)
+        if metrics is None or not metrics.request_count:
             return 0.0
+        window = sorted(metrics.recent_times[:min(metrics.request_count, LATENCY_WINDOW)])
+        rank = max(0, min(len(window) - 1, round(percentile / 100 * len(window)) - 1))
+        return window[rank]
 
     def get_model_metrics(self, model_id: str) -> Dict[str, Any]:
         """Get detailed metrics for a specific model"""
+        self.flush()
         if model_id not in self.model_metrics:
             return {}
 
@@ -79,6 +129,7 @@ class MetricsCollector:
         return {
             'request_count': metrics.request_count,
             'average_latency': self.get_inference_time_avg(model_id),
+            'p99_latency': self.get_inference_time_percentile(model_id, 99),
             'memory_usage': metrics.memory_usage,
             'hits': metrics.hits,
             'misses': metrics.misses
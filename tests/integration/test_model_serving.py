@@ -42,3 +42,19 @@ async def test_model_inference(client):
     outputs = response_data["outputs"]
     assert "output" in outputs
     assert isinstance(outputs["output"], list)  # Should be a single float in a list
+
+
+def test_inference_without_data_is_rejected(client):
+    """Test a request with no input data fails validation instead of reaching the model"""
+    response = client.post("/v1/models/simple_model/predict", json={"inputs": {}})
+
+    assert response.status_code == 422
+
+
+def test_inference_reports_configured_version(client):
+    """Test predictions report the same model version as the metadata endpoint"""
+    response = client.post("/v1/models/simple_model/predict", json={"inputs": {"data": [1.0, 2.0]}})
+    metadata = client.get("/v1/models/simple_model/metadata")
+
+    assert response.status_code == 200
+    assert response.json()["metadata"]["model_version"] == metadata.json()["version"]
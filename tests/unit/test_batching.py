@@ -0,0 +1,111 @@
+# tests/unit/test_batching.py
+import asyncio
+import pytest
+from src.portfolio.core.batching import InferenceBatcher, BatcherOverloadedError
+
+
+class FakeModelManager:
+    """Records each batched call and echoes inputs back as outputs"""
+
+    def __init__(self, fail: bool = False, drop_outputs: int = 0):
+        self.calls = []
+        self.fail = fail
+        self.drop_outputs = drop_outputs
+
+    async def predict_batch(self, model_id, inputs_list, params_list):
+        self.calls.append((model_id, len(inputs_list)))
+        if self.fail:
+            raise RuntimeError("boom")
+        outputs = [{"output": inputs["data"]} for inputs in inputs_list]
+        return outputs[:len(outputs) - self.drop_outputs]
+
+
+class TestInferenceBatcher:
+    """Test suite for the request-coalescing inference batcher"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_batched(self):
+        manager = FakeModelManager()
+        batcher = InferenceBatcher(manager, max_batch_size=8, batch_timeout_micros=50_000)
+
+        results = await asyncio.gather(*[
+            batcher.submit("model", {"data": [float(i), 0.0]}, {})
+            for i in range(5)
+        ])
+        await batcher.stop()
+
+        assert [r["output"][0] for r in results] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert manager.calls == [("model", 5)]
+
+    @pytest.mark.asyncio
+    async def test_batches_split_by_model_and_input_length(self):
+        manager = FakeModelManager()
+        batcher = InferenceBatcher(manager, max_batch_size=8, batch_timeout_micros=50_000)
+
+        await asyncio.gather(
+            batcher.submit("a", {"data": [1.0, 2.0]}, {}),
+            batcher.submit("b", {"data": [1.0, 2.0]}, {}),
+            batcher.submit("a", {"data": [1.0, 2.0, 3.0]}, {}),
+            batcher.submit("a", {"data": [3.0, 4.0]}, {}),
+        )
+        await batcher.stop()
+
+        assert sorted(manager.calls) == [("a", 1), ("a", 2), ("b", 1)]
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_is_respected(self):
+        manager = FakeModelManager()
+        batcher = InferenceBatcher(manager, max_batch_size=2, batch_timeout_micros=50_000)
+
+        await asyncio.gather(*[
+            batcher.submit("model", {"data": [1.0]}, {}) for _ in range(5)
+        ])
+        await batcher.stop()
+
+        assert [size for _, size in manager.calls] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_callers(self):
+        batcher = InferenceBatcher(FakeModelManager(fail=True), batch_timeout_micros=0)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await batcher.submit("model", {"data": [1.0]}, {})
+        await batcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_short_output_list_fails_every_caller(self):
+        batcher = InferenceBatcher(FakeModelManager(drop_outputs=1), max_batch_size=8, batch_timeout_micros=50_000)
+
+        results = await asyncio.wait_for(asyncio.gather(*[
+            batcher.submit("model", {"data": [1.0]}, {}) for _ in range(3)
+        ], return_exceptions=True), timeout=5)
+        await batcher.stop()
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert "2 outputs for a batch of 3" in str(results[0])
+
+    @pytest.mark.asyncio
+    async def test_requests_rejected_when_overloaded(self):
+        manager = FakeModelManager()
+        batcher = InferenceBatcher(manager, max_batch_size=8, batch_timeout_micros=50_000, max_pending=2)
+
+        results = await asyncio.gather(*[
+            batcher.submit("model", {"data": [1.0]}, {}) for _ in range(3)
+        ], return_exceptions=True)
+        await batcher.stop()
+
+        assert isinstance(results[2], BatcherOverloadedError)
+        assert all(isinstance(r, dict) for r in results[:2])
+        assert batcher.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_worker_without_awaiting(self):
+        batcher = InferenceBatcher(FakeModelManager())
+        batcher.start()
+        worker = batcher._worker
+
+        batcher.cancel()
+        await asyncio.wait([worker], timeout=1)
+
+        assert worker.cancelled()
+        assert batcher._worker is None
@@ -1,7 +1,15 @@
 # portfolio/tests/unit/test_cache.py
+from datetime import datetime
 import time
 import pytest
 from src.portfolio.core.cache import LRUCache, CacheEntry  # Updated import path
+from src.portfolio.core.policies import CACHE_POLICIES, LRUPolicy
+
+# Keys and values built once rather than formatted inside test loops
+_MODEL_KEYS = [f"model{i}" for i in range(5)]
+_MODEL_VALUES = [f"value{i}" for i in range(5)]
+_KV_KEYS = [f"key_{i}" for i in range(3)]
+_KV_VALUES = [f"value_{i}" for i in range(3)]
 
 class TestLRUCache:
     """Test suite for the LRU Cache implementation"""
@@ -83,10 +91,41 @@ class TestLRUCache:
         cache.put("model4", "value4", size_bytes=300)
 
         # model2 should be evicted as it's least recently used
-        assert cache.get("model1") == "value1"  # Should still be present
-        assert cache.get("model2") is None      # Should be evicted
-        assert cache.get("model3") == "value3"  # Should still be present
-        assert cache.get("model4") == "value4"  # Should be present
+        assert cache.mget(["model1", "model2", "model3", "model4"]) == {
+            "model1": "value1",
+            "model2": None,
+            "model3": "value3",
+            "model4": "value4",
+        }
+
+    def test_same_size_update_is_in_place(self, cache):
+        cache.put("model1", "value1", size_bytes=400)
+        cache.put("model2", "value2", size_bytes=400)
+        entry = cache._cache["model1"]
+
+        cache.put("model1", "new_value", size_bytes=400)
+
+        assert cache._cache["model1"] is entry
+        assert cache.get("model1") == "new_value"
+        assert cache._current_size_bytes == 800
+        # The update counts as a use, so model2 is now least recently used
+        cache.put("model3", "value3", size_bytes=400)
+        assert cache.get("model2") is None
+
+    def test_sizes_must_be_integers(self, cache):
+        with pytest.raises(TypeError):
+            cache.put("model1", "value1", size_bytes=100.5)
+        assert cache.count == 0
+
+    def test_mget_counts_hits_as_uses(self, cache):
+        cache.put("model1", "value1", size_bytes=400)
+        cache.put("model2", "value2", size_bytes=400)
+
+        assert cache.mget(["model1", "missing"]) == {"model1": "value1", "missing": None}
+
+        cache.put("model3", "value3", size_bytes=400)
+        assert cache.get("model2") is None
+        assert cache.get("model1") == "value1"
 
     def test_large_item_eviction(self, cache):
         """Test handling of items larger than soft limit"""
@@ -105,23 +144,33 @@ class TestLRUCache:
         assert cache.get("large") == "large_value"
         assert cache._current_size_bytes == 900
 
+    def test_soft_limit_drained_off_the_put_path(self, cache):
+        """Test put only enforces the hard limit and drain() trims to the soft limit"""
+        for key in ("model1", "model2", "model3"):
+            cache.put(key, key, size_bytes=300)
+
+        assert cache._current_size_bytes == 900
+        assert cache.needs_drain
+
+        assert cache.drain() == 300
+        assert cache.get("model1") is None
+        assert cache._current_size_bytes == 600
+        assert not cache.needs_drain
+
+    def test_drain_keeps_lone_large_item(self, cache):
+        cache.put("large", "large_value", size_bytes=900)
+
+        assert cache.drain() == 0
+        assert cache.get("large") == "large_value"
+
     def test_multiple_evictions(self, cache):
         """Test multiple items are evicted if needed"""
         # Add multiple small items
-        for i in range(5):
-            cache.put(f"model{i}", f"value{i}", size_bytes=200)
-            time.sleep(0.001)  # Ensure distinct access times
-
-        print("A")
-        cache._print_cache_state()
-        print("B")
+        for key, value in zip(_MODEL_KEYS, _MODEL_VALUES):
+            cache.put(key, value, size_bytes=200)
 
         # Add large item requiring multiple evictions
         cache.put("large", "large_value", size_bytes=700)
-        print("C")
-
-        cache._print_cache_state()
-        print("D")
 
         # Verify oldest items were evicted and newest remain
         assert cache.get("model0") is None
@@ -171,8 +220,8 @@ class TestLRUCache:
     def test_concurrent_size_tracking(self, cache):
         """Test that size tracking remains accurate through operations"""
         initial_sizes = [100, 200, 300]
-        for i, size in enumerate(initial_sizes):
-            cache.put(f"key_{i}", f"value_{i}", size_bytes=size)
+        for key, value, size in zip(_KV_KEYS, _KV_VALUES, initial_sizes):
+            cache.put(key, value, size_bytes=size)
 
         assert cache._current_size_bytes == sum(initial_sizes)  # Updated to match implementation
 
@@ -181,3 +230,262 @@ class TestLRUCache:
 
         expected_size = initial_sizes[0] + 150 + initial_sizes[2]
         assert cache._current_size_bytes == expected_size  # Updated to match implementation
+
+    def test_last_access_is_monotonic(self, cache):
+        """Test hits order entries by last use and report wall-clock last use"""
+        cache.put("a", "value_a", size_bytes=100)
+        cache.put("b", "value_b", size_bytes=100)
+        cache.get("a")
+
+        assert cache._cache["a"].last_used_at >= cache._cache["b"].last_used_at
+        assert isinstance(cache.get_last_access_time("a"), datetime)
+        assert cache.get_last_access_time("missing") is None
+        assert cache.get_last_access_timestamp("a") == pytest.approx(cache.get_last_access_time("a").timestamp(), abs=1e-3)
+        assert cache.get_last_access_timestamp("missing") is None
+
+    def test_hit_refreshes_last_access_time(self, cache, monkeypatch):
+        """Test a hit moves the last access time past the put time"""
+        cache.put("a", "value_a", size_bytes=100)
+        stored = cache.get_last_access_timestamp("a")
+
+        later = time.monotonic() + 60
+        monkeypatch.setattr(time, "monotonic", lambda: later)
+        cache.get("a")
+
+        assert cache.get_last_access_timestamp("a") == pytest.approx(stored + 60, abs=1)
+
+    def test_alternating_hits_update_both_entries(self, cache, monkeypatch):
+        """Test interleaved hits on two keys keep both entries' bookkeeping current"""
+        cache.put("a", "value_a", size_bytes=100)
+        cache.put("b", "value_b", size_bytes=100)
+
+        later = time.monotonic() + 60
+        monkeypatch.setattr(time, "monotonic", lambda: later)
+        for _ in range(400):
+            cache.get("a")
+            cache.get("b")
+
+        for key in ("a", "b"):
+            assert cache._cache[key].access_count == 400
+            assert cache._cache[key].last_used_at == later
+
+    def test_evicted_entries_are_recycled(self, cache):
+        """Test evicted entries drop their value and are reused by later puts"""
+        cache.put("a", "value_a", size_bytes=600)
+        first = cache._cache["a"]
+        cache.put("b", "value_b", size_bytes=600)
+
+        assert cache.get("a") is None
+        assert cache._cache["b"] is first
+        assert cache.get("b") == "value_b"
+
+        cache.remove("b")
+        assert first.value is None
+
+    def test_get_size_does_not_touch_recency(self, cache):
+        """Test get_size reports the stored size without refreshing the entry"""
+        cache.put("a", "value_a", size_bytes=400)
+        cache.put("b", "value_b", size_bytes=400)
+
+        assert cache.get_size("a") == 400
+        assert cache.get_size("missing") is None
+
+        cache.put("c", "value_c", size_bytes=400)
+        assert cache.get("a") is None
+
+
+class TestCounterPolicy:
+    """Test suite for the counter-based eviction policy"""
+
+    @pytest.fixture
+    def cache(self):
+        return LRUCache(max_size_bytes=1000, policy="counter")
+
+    def test_least_hit_entry_is_evicted(self, cache):
+        cache.put("hot", "value_hot", size_bytes=400)
+        cache.put("cold", "value_cold", size_bytes=400)
+        for _ in range(3):
+            cache.get("hot")
+        cache.get("cold")
+
+        cache.put("new", "value_new", size_bytes=400)
+
+        assert cache.get("cold") is None
+        assert cache.get("hot") == "value_hot"
+        assert cache.get("new") == "value_new"
+
+    def test_ties_evict_oldest_insertion(self, cache):
+        cache.put("first", "value_first", size_bytes=400)
+        cache.put("second", "value_second", size_bytes=400)
+
+        cache.put("third", "value_third", size_bytes=400)
+
+        assert cache.get("first") is None
+        assert cache.get("second") == "value_second"
+
+    def test_saturated_counters_are_halved(self, cache):
+        cache.put("a", "value_a", size_bytes=100)
+        cache.put("b", "value_b", size_bytes=100)
+        for _ in range(255):
+            cache.get("a")
+        cache.get("b")
+
+        cache.get("a")
+
+        assert cache._cache["a"].hits == 128
+        assert cache._cache["b"].hits == 0
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError):
+            LRUCache(max_size_bytes=1000, policy="random")
+
+
+class TestClockPolicy:
+    """Test suite for the CLOCK (second-chance) eviction policy"""
+
+    @pytest.fixture
+    def cache(self):
+        return LRUCache(max_size_bytes=1000, policy="clock")
+
+    def test_referenced_entry_gets_second_chance(self, cache):
+        cache.put("first", "value_first", size_bytes=400)
+        cache.put("second", "value_second", size_bytes=400)
+        cache.get("first")
+
+        cache.put("third", "value_third", size_bytes=400)
+
+        assert cache.get("second") is None
+        assert cache.get("first") == "value_first"
+        assert cache.get("third") == "value_third"
+
+    def test_hits_do_not_reorder(self, cache):
+        cache.put("a", "value_a", size_bytes=100)
+        cache.put("b", "value_b", size_bytes=100)
+
+        cache.get("a")
+
+        assert list(cache._cache) == ["a", "b"]
+        assert cache._cache["a"].referenced
+
+    def test_all_referenced_evicts_oldest_after_full_sweep(self, cache):
+        cache.put("first", "value_first", size_bytes=400)
+        cache.put("second", "value_second", size_bytes=400)
+        cache.get("first")
+        cache.get("second")
+
+        cache.put("third", "value_third", size_bytes=400)
+
+        assert cache.get("first") is None
+        assert cache.get("second") == "value_second"
+
+
+class TestSievePolicy:
+    """Test suite for the SIEVE eviction policy"""
+
+    @pytest.fixture
+    def cache(self):
+        return LRUCache(max_size_bytes=1000, policy="sieve")
+
+    def test_visited_entry_survives_in_place(self, cache):
+        cache.put("first", "value_first", size_bytes=400)
+        cache.put("second", "value_second", size_bytes=400)
+        cache.get("first")
+
+        cache.put("third", "value_third", size_bytes=400)
+
+        assert cache.get("second") is None
+        assert list(cache._cache) == ["first", "third"]
+        assert not cache._cache["first"].referenced
+
+    def test_hand_resumes_after_last_victim(self, cache):
+        for key in ("a", "b", "c", "d"):
+            cache.put(key, f"value_{key}", size_bytes=250)
+        cache.get("a")
+        cache.get("c")
+
+        cache.put("e", "value_e", size_bytes=250)  # clears a, evicts b
+        cache.get("a")
+        cache.put("f", "value_f", size_bytes=250)  # resumes at c: clears c, evicts d
+
+        assert cache.get("b") is None
+        assert cache.get("d") is None
+        assert {"a", "c", "e", "f"} == set(cache._cache)
+
+
+class TestCachePolicies:
+    """Behaviour shared by every policy, and scan resistance of ARC and 2Q"""
+
+    @pytest.mark.parametrize("policy", list(CACHE_POLICIES))
+    def test_size_accounting_under_churn(self, policy):
+        cache = LRUCache(max_size_bytes=1000, policy=policy)
+        for i in range(200):
+            key = f"key_{i % 17}"
+            if i % 5 == 0:
+                cache.remove(f"key_{(i * 7) % 17}")
+            elif cache.get(key) is None:
+                cache.put(key, i, size_bytes=100 + (i % 4) * 50)
+
+        assert cache._current_size_bytes == sum(e.size_bytes for e in cache._cache.values())
+        assert cache._current_size_bytes <= 1000
+        # Every remaining entry can still be evicted through the policy
+        cache.put("full", "value_full", size_bytes=1000)
+        assert list(cache._cache) == ["full"]
+
+    @pytest.mark.parametrize("policy", list(CACHE_POLICIES))
+    def test_drain_keeps_just_inserted_entry(self, policy):
+        cache = LRUCache(max_size_bytes=1000, soft_limit_bytes=800, policy=policy)
+        cache.put("a", "value_a", size_bytes=300)
+        cache.put("b", "value_b", size_bytes=300)
+        cache.get("a")
+        cache.get("b")
+        cache.put("new", "value_new", size_bytes=300)
+
+        assert cache.drain() == 300
+        assert "new" in cache._cache
+        assert cache._current_size_bytes == 600
+
+    def test_policy_instance_accepted(self):
+        cache = LRUCache(max_size_bytes=1000, policy=LRUPolicy())
+        cache.put("a", "value_a", size_bytes=600)
+        cache.put("b", "value_b", size_bytes=600)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == "value_b"
+
+    def test_arc_keeps_reused_entry_through_scan(self):
+        cache = LRUCache(max_size_bytes=1000, policy="arc")
+        cache.put("hot", "value_hot", size_bytes=100)
+        cache.get("hot")
+
+        for i in range(20):
+            cache.put(f"scan_{i}", i, size_bytes=100)
+
+        assert cache.get("hot") == "value_hot"
+
+    def test_arc_ghost_hit_grows_recency_target(self):
+        cache = LRUCache(max_size_bytes=1000, policy="arc")
+        cache.put("a", "value_a", size_bytes=300)
+        cache.put("b", "value_b", size_bytes=300)
+        cache.get("b")
+        cache.put("c", "value_c", size_bytes=300)
+        cache.put("d", "value_d", size_bytes=300)  # evicts a into the B1 ghost list
+        assert cache.get("a") is None
+
+        cache.put("a", "value_a", size_bytes=300)
+
+        assert cache._policy._p > 0
+        assert "a" in cache._policy._t2
+
+    def test_2q_readmitted_entry_survives_scan(self):
+        cache = LRUCache(max_size_bytes=1000, policy="2q")
+        cache.put("hot", "value_hot", size_bytes=100)
+        for i in range(10):
+            cache.put(f"scan_{i}", i, size_bytes=100)
+        assert cache.get("hot") is None
+
+        # Put again while remembered in A1out: promoted to the main queue
+        cache.put("hot", "value_hot", size_bytes=100)
+        for i in range(10, 30):
+            cache.put(f"scan_{i}", i, size_bytes=100)
+
+        assert cache.get("hot") == "value_hot"
@@ -0,0 +1,27 @@
+# tests/unit/test_config.py
+import os
+from src.portfolio.core.config import read_config_file
+
+
+class TestReadConfigFile:
+    """Test suite for cached YAML config parsing"""
+
+    def test_returns_independent_copies(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("cache:\n  max_memory: 1GB\n")
+
+        first = read_config_file(str(path))
+        first["cache"]["max_memory"] = "2GB"
+
+        assert read_config_file(str(path))["cache"]["max_memory"] == "1GB"
+
+    def test_reparses_when_file_changes(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("cache:\n  max_memory: 1GB\n")
+        assert read_config_file(str(path))["cache"]["max_memory"] == "1GB"
+
+        path.write_text("cache:\n  max_memory: 512MB\n")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert read_config_file(str(path))["cache"]["max_memory"] == "512MB"
@@ -0,0 +1,30 @@
+# tests/unit/test_dependencies.py
+import asyncio
+import pytest
+from fastapi import FastAPI
+from portfolio.api.dependencies import (  # the app resolves imports via portfolio.*
+    init_inference_batcher,
+    init_model_manager,
+    reset_model_manager,
+)
+
+
+class TestResetModelManager:
+    """Test suite for resetting the dependency singletons"""
+
+    @pytest.mark.asyncio
+    async def test_reset_stops_batcher_and_refreshes_app_state(self):
+        app = FastAPI()
+        app.state.model_manager = init_model_manager()
+        app.state.inference_batcher = init_inference_batcher()
+        app.state.inference_batcher.start()
+        old_manager = app.state.model_manager
+        worker = app.state.inference_batcher._worker
+
+        reset_model_manager(app)
+        await asyncio.wait([worker], timeout=1)
+
+        assert worker.cancelled()
+        assert not hasattr(app.state, "model_manager")
+        assert not hasattr(app.state, "inference_batcher")
+        assert init_model_manager() is not old_manager
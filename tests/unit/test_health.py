@@ -0,0 +1,48 @@
+# tests/unit/test_health.py
+import asyncio
+import time
+import pytest
+from fastapi.testclient import TestClient
+from portfolio.core.manager import ModelManager  # the app resolves imports via portfolio.*
+from src.portfolio.main import app
+
+
+@pytest.fixture
+def restore_app_state():
+    """Undo the state the lifespan leaves on the shared app"""
+    saved = dict(app.state._state)
+    yield
+    app.state._state.clear()
+    app.state._state.update(saved)
+
+
+class TestHealthCheck:
+    """Test suite for the readiness-gated health endpoint"""
+
+    def test_unready_while_warming_up(self, monkeypatch, restore_app_state):
+        async def slow_preload(self, warmup_iterations: int = 3):
+            await asyncio.sleep(3600)
+
+        monkeypatch.setattr(ModelManager, "preload_models", slow_preload)
+
+        with TestClient(app) as client:
+            response = client.get("/v1/health")
+
+        assert response.status_code == 503
+        assert response.json() == {"status": "starting"}
+
+    def test_ready_once_warm_up_finishes(self, monkeypatch, restore_app_state):
+        async def instant_preload(self, warmup_iterations: int = 3):
+            pass
+
+        monkeypatch.setattr(ModelManager, "preload_models", instant_preload)
+
+        with TestClient(app) as client:
+            deadline = time.monotonic() + 5
+            response = client.get("/v1/health")
+            while response.status_code != 200 and time.monotonic() < deadline:
+                time.sleep(0.01)
+                response = client.get("/v1/health")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy"}
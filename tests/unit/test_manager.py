@@ -0,0 +1,52 @@
+# tests/unit/test_manager.py
+import asyncio
+import pytest
+from src.portfolio.core.manager import ModelManager
+
+
+class TestParseSize:
+    """Test suite for ModelManager size string parsing"""
+
+    @pytest.mark.parametrize("size_str, expected", [
+        ("10B", 10),
+        ("1KB", 1024),
+        ("100MB", 100 * 1024 ** 2),
+        ("1GB", 1024 ** 3),
+        ("2TB", 2 * 1024 ** 4),
+        ("1.5 gb", int(1.5 * 1024 ** 3)),
+        ("  512 MB  ", 512 * 1024 ** 2),
+    ])
+    def test_valid_sizes(self, size_str, expected):
+        assert ModelManager._parse_size(size_str) == expected
+
+    @pytest.mark.parametrize("size_str", [
+        "", "GB", "1", "1XB", "-1GB", "1.GB", ".5GB", "1e3MB", "infGB", "1 G B"
+    ])
+    def test_invalid_sizes(self, size_str):
+        with pytest.raises(ValueError):
+            ModelManager._parse_size(size_str)
+
+    def test_non_string_rejected(self):
+        with pytest.raises(ValueError):
+            ModelManager._parse_size(1024)
+
+
+class TestGetModel:
+    """Test suite for ModelManager model loading"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        manager = ModelManager("config/development/config.yaml")
+        loads = []
+
+        async def slow_load(model_id):
+            loads.append(model_id)
+            await asyncio.sleep(0.01)
+            return object()
+
+        manager._load_model = slow_load
+        models = await asyncio.gather(*[manager.get_model("simple_model") for _ in range(3)])
+
+        assert loads == ["simple_model"]
+        assert models[0] is models[1] is models[2]
+        assert not manager._loading
@@ -0,0 +1,60 @@
+# tests/unit/test_metrics.py
+import pytest
+from src.portfolio.utils.metrics import LATENCY_WINDOW, MetricsCollector
+
+
+class TestMetricsCollector:
+    """Test suite for inference metrics aggregation"""
+
+    @pytest.fixture
+    def metrics(self):
+        return MetricsCollector()
+
+    def test_request_count_is_immediate(self, metrics):
+        metrics.record_inference("model1", 0.1)
+        metrics.record_inference("model2", 0.2)
+
+        assert metrics.get_request_count() == 2
+
+    def test_average_latency_per_model(self, metrics):
+        metrics.record_inference("model1", 0.1)
+        metrics.record_inference("model1", 0.3)
+        metrics.record_inference("model2", 1.0)
+
+        assert metrics.get_inference_time_avg("model1") == pytest.approx(0.2)
+        assert metrics.get_inference_time_avg("model2") == pytest.approx(1.0)
+        assert metrics.get_inference_time_avg("unknown") == 0.0
+
+    def test_model_metrics_include_buffered_records(self, metrics):
+        metrics.record_inference("model1", 0.5)
+
+        model_metrics = metrics.get_model_metrics("model1")
+        assert model_metrics["request_count"] == 1
+        assert model_metrics["average_latency"] == pytest.approx(0.5)
+
+    def test_latency_percentiles_use_recent_window(self, metrics):
+        for i in range(1, 101):
+            metrics.record_inference("model1", i / 1000)
+
+        assert metrics.get_inference_time_percentile("model1", 50) == pytest.approx(0.050)
+        assert metrics.get_inference_time_percentile("model1", 99) == pytest.approx(0.099)
+        assert metrics.get_inference_time_percentile("unknown", 99) == 0.0
+
+    def test_latency_window_is_bounded(self, metrics):
+        for _ in range(LATENCY_WINDOW):
+            metrics.record_inference("model1", 1.0)
+        for _ in range(LATENCY_WINDOW):
+            metrics.record_inference("model1", 0.1)
+
+        assert metrics.get_inference_time_percentile("model1", 100) == pytest.approx(0.1)
+        assert len(metrics.model_metrics["model1"].recent_times) == LATENCY_WINDOW
+
+    def test_bounded_flush_leaves_remaining_records_buffered(self, metrics):
+        for _ in range(5):
+            metrics.record_inference("model1", 0.1)
+
+        metrics.flush(max_items=3)
+        assert metrics.model_metrics["model1"].request_count == 3
+
+        metrics.flush()
+        assert metrics.model_metrics["model1"].request_count == 5
@@ -0,0 +1,29 @@
+# tests/unit/test_prediction_request.py
+import pytest
+from pydantic import ValidationError
+from src.portfolio.models.schemas.prediction_request import PredictionRequest
+
+
+class TestPredictionRequest:
+    """Test suite for prediction request validation"""
+
+    def test_data_is_coerced_to_floats(self):
+        request = PredictionRequest(inputs={"data": [1, 2.5]})
+
+        assert request.inputs["data"] == [1.0, 2.5]
+        assert request.parameters == {}
+
+    def test_extra_input_keys_are_kept(self):
+        request = PredictionRequest(inputs={"data": [1.0], "mask": [1]})
+
+        assert request.inputs["mask"] == [1]
+
+    @pytest.mark.parametrize("inputs", [{}, {"text": "hi"}])
+    def test_missing_data_is_rejected(self, inputs):
+        with pytest.raises(ValidationError):
+            PredictionRequest(inputs=inputs)
+
+    @pytest.mark.parametrize("data", [[], [[1.0], [2.0, 3.0]], ["a"]])
+    def test_invalid_data_is_rejected(self, data):
+        with pytest.raises(ValidationError):
+            PredictionRequest(inputs={"data": data})
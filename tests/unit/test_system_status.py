@@ -3,8 +3,9 @@ import pytest
 from fastapi.testclient import TestClient
 from src.portfolio.main import app
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
+    # One client for the module; tests must not depend on each other's model loads
     return TestClient(app)
 
 def test_system_status_endpoint(client):
@@ -14,20 +15,29 @@ def test_system_status_endpoint(client):
     assert response.status_code == 200
 
     data = response.json()
-    assert isinstance(data["active_models"], int)
-    assert isinstance(data["total_memory_usage"], str)
-    assert isinstance(data["cache_utilization"], float)
-    assert isinstance(data["healthy"], bool)
-    assert isinstance(data["uptime"], str)
+    active, memory, memory_bytes, utilization, healthy, uptime = (
+        data["active_models"],
+        data["total_memory_usage"],
+        data["total_memory_bytes"],
+        data["cache_utilization"],
+        data["healthy"],
+        data["uptime"],
+    )
+    assert isinstance(active, int)
+    assert isinstance(memory, str)
+    assert isinstance(memory_bytes, int)
+    assert isinstance(utilization, float)
+    assert isinstance(healthy, bool)
+    assert isinstance(uptime, str)
 
     # Verify memory usage format
-    assert "MB" in data["total_memory_usage"]
+    assert "MB" in memory
 
     # Verify cache utilization is between 0 and 1
-    assert 0 <= data["cache_utilization"] <= 1
+    assert 0 <= utilization <= 1
 
     # Verify uptime format
-    assert "s" in data["uptime"]
+    assert "s" in uptime
 
 
 def test_system_status_with_loaded_models(client):
@@ -42,4 +52,4 @@ def test_system_status_with_loaded_models(client):
 
     data = response.json()
     assert data["active_models"] > 0
-    assert float(data["total_memory_usage"].replace("MB", "")) > 0
+    assert data["total_memory_bytes"] > 0